@@ -1,26 +1,63 @@
 # Standard Library
 import contextlib
-from collections.abc import Callable
-from cProfile import Profile
+import json
+import math
+import resource
+import subprocess
+import sys
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable
+from dataclasses import asdict
 from enum import Enum
+from functools import partial
 from importlib import import_module
+from importlib.util import find_spec
 from pathlib import Path
-from pstats import Stats
-from statistics import mean
-from time import time
-from typing import Any
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any, Literal, TypeVar
 
 # Third Party
 import typer
-from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
 
 # First Party
 from utils import read_input
+from utils.cache import DiskCache, cache_key
+from utils.collections import CacheStats, recording_caches
+from utils.counting import Counts, count
+from utils.execution import NO_LIMITS, Limits, Outcome, Usage, max_rss, run_inline, run_limited, thread_usage
+from utils.gcstats import GCStats, gc_mode, watching
+from utils.helpers import file_hash, input_path
+from utils.history import (
+    HistoryRecord,
+    append_history,
+    change,
+    find_baseline,
+    git_commit,
+    input_hash,
+    load_history,
+    now,
+)
+from utils.scaling import Curve, scalable, sizes
+from utils.solver import clear_caches, module_caches, prepare
+from utils.spans import recording
+from utils.stats import NS_PER_SECOND, Memory, Timing, human_bytes, human_time
+from utils.variants import disagreement, has_variants, variants
 
 app = typer.Typer()
 
+T = TypeVar("T")
+Column = tuple[str, Literal["left", "right"], Callable[[str, int], str]]
+
+TIMINGS_FILE = Path(".timings.json")
+HISTORY_FILE = Path(".benchmark-history.jsonl")
+ANSWERS_CACHE = Path(".cache/answers")
+SRC = Path(__file__).parent
+STALL_RATIO = 0.5
+# getrusage is tick based on most kernels, so short runs can't be judged reliably
+STALL_MIN_WALL = 0.1
+
 
 class DayType(str, Enum):
     # [[[cog
@@ -61,104 +98,1109 @@ class SortType(str, Enum):
     TIME = "time"
 
 
+class ProfileFormat(str, Enum):
+    PSTATS = "pstats"
+    COLLAPSED = "collapsed"
+    SPEEDSCOPE = "speedscope"
+    JSON = "json"
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class OutputFormat(str, Enum):
+    TABLE = "table"
+    JSON = "json"
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+class CacheMode(str, Enum):
+    COLD = "cold"
+    WARM = "warm"
+    FRESH = "fresh"
+
+
+class GCMode(str, Enum):
+    ON = "on"
+    OFF = "off"
+    FREEZE = "freeze"
+
+
 class PartType(str, Enum):
     PART_1 = "part_1"
     PART_2 = "part_2"
 
 
-def time_it(day: str, iterations: int = 1, progress: Callable[..., Any] = lambda: None) -> tuple[float, float]:
+def time_it(  # noqa: PLR0913
+    day: str,
+    part: int,
+    iterations: int = 1,
+    warmup: int = 0,
+    phases: bool = False,
+    progress: Callable[..., Any] = lambda: None,
+    impl: str | None = None,
+    caches: str = "cold",
+    gc: str = "on",
+) -> Timing:
+    if caches == "fresh":
+        return time_it_fresh(day, part, iterations, progress)
+
     module = import_module(day)
     input_str = read_input(day)
+    found = module_caches(module) if caches == "cold" else []
 
-    times: dict[int, list[float]] = {}
-
-    for i in [1, 2]:
-        times[i] = []
-        for _ in range(iterations):
-            start = time()
-            with contextlib.suppress(Exception):
-                getattr(module, f"part_{i}")(input_str)
-            times[i].append(time() - start)
+    times: list[int] = []
+    warm: list[int] = []
+    warm_error = None
+    collector = GCStats()
+    spent = Usage()
+    try:
+        if impl is None:
+            solver, parse_time = prepare(module, part, input_str)
+        else:
+            # Variants only take the raw input, so when comparing them the default includes parse too
+            solver, parse_time = partial(variants(module, part)[impl], input_str), math.nan
+        for _ in range(warmup):
+            solver()
             progress()
 
-    return mean(times[1]), mean(times[2])
+        with recording(phases) as totals, gc_mode(gc):
+            for _ in range(iterations):
+                clear_caches(found)
+                with watching(collector):
+                    before = thread_usage()
+                    start = perf_counter_ns()
+                    solver()
+                    times.append(perf_counter_ns() - start)
+                    spent += Usage.between(before, thread_usage())
+                if found and warm_error is None:
+                    # A solver that only breaks on warm caches still has valid cold timings
+                    try:
+                        with recording(phases):
+                            start = perf_counter_ns()
+                            solver()
+                            warm.append(perf_counter_ns() - start)
+                    except Exception as e:  # noqa: BLE001
+                        warm_error = type(e).__name__
+                progress()
+    except Exception as e:  # noqa: BLE001
+        return Timing.from_ns(times, type(e).__name__)
+
+    return Timing.from_ns(
+        times,
+        phases_ns=totals,
+        parse=parse_time,
+        warm_ns=warm,
+        gc=collector,
+        usage=spent,
+        warm_error=warm_error,
+    )
+
+
+def time_it_fresh(day: str, part: int, iterations: int, progress: Callable[..., Any] = lambda: None) -> Timing:
+    from utils.revisions import Runner
+
+    times: list[int] = []
+    warm: list[int] = []
+    warm_error = None
+    for _ in range(iterations):
+        with Runner(SRC, day, part, input_path(day)) as runner:
+            cold = runner.run()
+            again = runner.run(warm=True) if cold is not None and warm_error is None else None
+        if cold is None:
+            return Timing.from_ns(times, runner.error)
+        times.append(cold)
+        if again is not None:
+            warm.append(again)
+        elif warm_error is None:
+            warm_error = runner.error
+        progress()
+    return Timing.from_ns(times, warm_ns=warm, warm_error=warm_error)
+
+
+def memory_it(day: str, part: int) -> Memory:
+    module = import_module(day)
+    input_str = read_input(day)
+    solver = getattr(module, f"part_{part}")
+
+    tracemalloc.start()
+    try:
+        solver(input_str)
+    except Exception as e:  # noqa: BLE001
+        return Memory(math.nan, math.nan, type(e).__name__)
+    finally:
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return Memory(traced_peak, max_rss(resource.getrusage(resource.RUSAGE_SELF)))
+
+
+def count_it(day: str, part: int) -> Counts:
+    module = import_module(day)
+    return count(getattr(module, f"part_{part}"), read_input(day))
+
+
+def cache_it(day: str, part: int) -> CacheStats | str:
+    with recording_caches() as found:
+        try:
+            getattr(import_module(day), f"part_{part}")(read_input(day))
+        except Exception as e:  # noqa: BLE001
+            return type(e).__name__
+    return sum(found, CacheStats())
+
+
+def scale_it(  # noqa: PLR0913
+    day: str,
+    part: int,
+    steps: int = 5,
+    factor: float = 2,
+    iterations: int = 3,
+    limits: Limits = NO_LIMITS,
+) -> Curve:
+    module = import_module(day)
+    solver = getattr(module, f"part_{part}")
+
+    curve = Curve()
+    for size in sizes(module.SCALING.base, steps, factor):
+        times: list[float] = []
+        for seed in range(iterations):
+            input_str = module.generate(size, seed)
+            outcome = run_limited(solver, input_str, limits=limits) if limits.active else run_inline(solver, input_str)
+            if not outcome.ok:
+                curve.error = outcome.status if outcome.status != "error" else outcome.error
+                return curve
+            times.append(outcome.wall)
+        curve.sizes.append(size)
+        curve.times.append(Timing(times).median)
+    return curve
+
+
+def check_inputs(module: ModuleType) -> list[tuple[str, str]]:
+    inputs: list[tuple[str, str]] = []
+    with contextlib.suppress(FileNotFoundError):
+        inputs.append(("the real input", read_input(module.__name__)))
+    if scalable(module):
+        inputs.extend((f"generated size {size}", module.generate(size)) for size in sizes(module.SCALING.base, 3, 2))
+    return inputs
+
+
+def time_variants(day: str, part: int, **kwargs: Any) -> tuple[str | None, dict[str, Timing]]:
+    module = import_module(day)
+    mismatch = disagreement(module, part, check_inputs(module))
+    if mismatch is not None:
+        return mismatch, {}
+    return None, {name: time_it(day, part, impl=name, **kwargs) for name in variants(module, part)}
+
+
+def time_it_limited(day: str, part: int, limits: Limits, **kwargs: Any) -> Timing:
+    outcome = run_limited(time_it, day, part, limits=limits, **kwargs)
+    return outcome.value if outcome.ok else Timing.from_ns([], outcome.status)
+
+
+def make_limits(timeout: float | None, cpu_limit: float | None, memory_limit: int | None) -> Limits:
+    return Limits(timeout, cpu_limit, memory_limit * 1024 * 1024 if memory_limit is not None else None)
+
+
+def day_names(days: list[str]) -> list[str]:
+    if not days:
+        return [p.name.replace(".py", "") for p in list(Path("./src").glob("day_*.py"))]
+    return [str(d) for d in days]
+
+
+def load_timings() -> dict[str, float]:
+    try:
+        return json.loads(TIMINGS_FILE.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(timings: dict[str, float]) -> None:
+    TIMINGS_FILE.write_text(json.dumps(load_timings() | timings, indent=2, sort_keys=True))
+
+
+def schedule(days: Iterable[str]) -> list[tuple[str, int]]:
+    timings = load_timings()
+    tasks = [(day, part) for day in sorted(days) for part in [1, 2]]
+    if len(timings):
+        tasks.sort(key=lambda task: timings.get(f"{task[0]}.part_{task[1]}", float("inf")), reverse=True)
+    return tasks
+
+
+def run_tasks(
+    func: Callable[..., T],
+    tasks: list[tuple[str, int]],
+    jobs: int,
+    fresh: bool = False,
+    **kwargs: Any,
+) -> Generator[tuple[tuple[str, int], T], None, None]:
+    if jobs <= 1 and not fresh:
+        for task in tasks:
+            yield task, func(*task, **kwargs)
+        return
+
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    # Progress runs a refresh thread, and forking a threaded process can deadlock the workers
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max(jobs, 1), context, max_tasks_per_child=1 if fresh else None) as pool:
+        futures = {pool.submit(func, *task, **kwargs): task for task in tasks}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def collect(  # noqa: PLR0913
+    description: str,
+    func: Callable[..., T],
+    days: list[str],
+    jobs: int,
+    ticks: int = 1,
+    fresh: bool = False,
+    on_result: Callable[[str, int, T], None] = lambda *_: None,
+    **kwargs: Any,
+) -> dict[str, dict[int, T]]:
+    from rich.console import Console
+    from rich.progress import Progress
+
+    results: dict[str, dict[int, T]] = defaultdict(dict)
+    with Progress(transient=True, console=Console(stderr=True)) as progress:
+        task = progress.add_task(description, total=len(days) * 2 * ticks)
+        live = jobs <= 1 and not fresh and ticks > 1
+        if live:
+            kwargs["progress"] = lambda: progress.update(task, advance=1)
+        for (day, part), result in run_tasks(func, schedule(days), jobs, fresh, **kwargs):
+            results[day][part] = result
+            on_result(day, part, result)
+            if not live:
+                progress.update(task, advance=ticks)
+    return results
+
+
+def timing_columns(result: Timing) -> list[str]:
+    if not result.ok:
+        return [f"[red]✗ {result.error}[/red]", "", "", "", ""]
+    return [
+        human_time(result.min),
+        human_time(result.median),
+        human_time(result.p95),
+        human_time(result.stddev),
+        f"{result.outliers}",
+    ]
+
+
+def phases_column(result: Timing) -> str:
+    if not result.ok or not result.phases:
+        return "-"
+    phases = sorted(result.phases.items(), key=lambda phase: phase[1], reverse=True)
+    phases.append(("other", max(1 - sum(result.phases.values()), 0)))
+    return " · ".join(f"{name} {share:.0%}" for name, share in phases)
+
+
+def warm_column(result: Timing) -> str:
+    if result.warm_error is not None:
+        return f"[red]✗ {result.warm_error}[/red]"
+    return human_time(result.warm)
+
+
+def gc_column(result: Timing) -> str:
+    if not result.ok or math.isnan(result.gc_pause):
+        return "-"
+    return f"{result.gc_collections:,} / {human_time(result.gc_pause)}"
+
+
+def measurable(result: Timing) -> bool:
+    return result.ok and not math.isnan(result.busy) and result.mean * result.iterations >= STALL_MIN_WALL
+
+
+def stalled(result: Timing) -> bool:
+    return measurable(result) and result.busy < STALL_RATIO
+
+
+def warn_stalled(results: dict[str, dict[int, Timing]], stderr: bool) -> None:
+    from rich.console import Console
+
+    if waiting := sorted(f"{day}.part_{part}" for day, parts in results.items() for part, r in parts.items() if stalled(r)):
+        message = f"[yellow]{', '.join(waiting)} spent less than {STALL_RATIO:.0%} of wall time on CPU[/yellow]"
+        Console(stderr=stderr).print(message)
+
+
+def usage_columns(result: Timing) -> list[str]:
+    if not result.ok or result.usage is None:
+        return ["-", "-", "-"]
+    spent = result.usage
+    cpu = human_time(spent.cpu / result.iterations)
+    if measurable(result):
+        cpu += f" ({result.busy:.0%})"
+    return [
+        f"[yellow]! {cpu}[/yellow]" if stalled(result) else cpu,
+        f"{spent.voluntary:,} / {spent.involuntary:,}",
+        f"{spent.major_faults:,} / {spent.minor_faults:,}",
+    ]
+
+
+def exponent_column(curve: Curve, expected: float, tolerance: float) -> tuple[str, bool]:
+    exponent = curve.exponent
+    if not curve.ok or math.isnan(exponent):
+        return "-", False
+    if exponent > expected + tolerance:
+        return f"[red]▲ {exponent:.2f}[/red]", True
+    return f"{exponent:.2f}", False
+
+
+def compare_column(history: list[HistoryRecord], record: HistoryRecord, threshold: float) -> tuple[str, bool]:
+    baseline = find_baseline(history, record)
+    if not record.ok or baseline is None:
+        return "-", False
+
+    delta = change(baseline, record)
+    if delta > threshold:
+        return f"[red]▲ {delta:+.1%}[/red]", True
+    if delta < -threshold:
+        return f"[green]▼ {delta:+.1%}[/green]", False
+    return f"{delta:+.1%}", False
+
+
+def count_column(history: list[HistoryRecord], record: HistoryRecord, compare: bool) -> str:
+    if record.instructions is None:
+        return "-"
+    baseline = find_baseline(history, record, counted=True) if compare else None
+    if baseline is None or not baseline.instructions:
+        return f"{record.instructions:,}"
+    delta = (record.instructions - baseline.instructions) / baseline.instructions
+    if delta > 0:
+        return f"{record.instructions:,} [red]{delta:+.2%}[/red]"
+    if delta < 0:
+        return f"{record.instructions:,} [green]{delta:+.2%}[/green]"
+    return f"{record.instructions:,} {delta:+.2%}"
 
 
 @app.command()
-def benchmark(iterations: int = 10, days: list[str] = []) -> None:
-    table = Table(title=f"AOC 2023 - Timings\n({iterations:,} iterations)")
+def benchmark(  # noqa: PLR0913
+    iterations: int = 10,
+    warmup: int = 1,
+    days: list[str] = [],
+    jobs: int = 1,
+    compare: bool = False,
+    threshold: float = 0.1,
+    memory: bool = False,
+    phases: bool = False,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+    memory_limit: int | None = None,
+    scale: bool = False,
+    steps: int = 5,
+    factor: float = 2,
+    tolerance: float = 0.5,
+    impl: bool = False,
+    count: bool = False,
+    against: str | None = None,
+    caches: CacheMode = CacheMode.COLD,
+    gc: GCMode = GCMode.ON,
+    usage: bool = False,
+    cache_stats: bool = False,
+    format: OutputFormat = OutputFormat.TABLE,
+) -> None:
+    from rich.console import Console
+    from utils.report import Report
+
+    _days = day_names(days)
+    if format is not OutputFormat.TABLE and (scale or impl or against is not None):
+        raise typer.BadParameter("--scale, --impl and --against only print tables", param_hint="'--format'")
+    if caches is CacheMode.FRESH and gc is not GCMode.ON:
+        raise typer.BadParameter("--gc can't be changed for fresh interpreters", param_hint="'--gc'")
+    if against is not None:
+        benchmark_against(_days, against, iterations, warmup, threshold)
+        return
+    if scale:
+        benchmark_scaling(_days, iterations, jobs, steps, factor, tolerance, make_limits(timeout, cpu_limit, memory_limit))
+        return
+    if impl:
+        benchmark_variants(_days, iterations, warmup, jobs)
+        return
+
+    limits = make_limits(timeout, cpu_limit, memory_limit)
+    timing: dict[str, Any] = {
+        "iterations": iterations,
+        "warmup": warmup,
+        "phases": phases,
+        "caches": caches.value,
+        "gc": gc.value,
+    }
+    if limits.active:
+        timing["limits"] = limits
+    func, ticks = (time_it_limited, 1) if limits.active else (time_it, iterations + warmup)
+    memory_results = collect("Measuring memory", memory_it, _days, jobs, fresh=True) if memory else {}
+    count_results = collect("Counting instructions", count_it, _days, jobs, fresh=True) if count else {}
+    cache_results = collect("Counting cache hits", cache_it, _days, jobs, fresh=True) if cache_stats else {}
+
+    history = load_history(HISTORY_FILE)
+    commit, timestamp = git_commit(), now()
+    records: dict[tuple[str, int], HistoryRecord] = {}
+    changes: dict[tuple[str, int], tuple[str, bool]] = {}
+    report = Report(format.value) if format is not OutputFormat.TABLE else None
+
+    def record(day: str, part: int, result: Timing) -> None:
+        counts = count_results.get(day, {}).get(part)
+        instructions = counts.instructions if counts is not None and counts.ok else None
+        records[day, part] = HistoryRecord.from_timing(
+            day,
+            part,
+            commit,
+            timestamp,
+            result,
+            instructions,
+            gc=gc.value,
+            caches=caches.value,
+            warmup=warmup,
+            limited=limits.active,
+        )
+        if compare:
+            changes[day, part] = compare_column(history, records[day, part], threshold)
+        if report is not None:
+            memory_result, cached = memory_results.get(day, {}).get(part), cache_results.get(day, {}).get(part)
+            report.write(timing_record(records[day, part], result, memory_result, counts, history, cached))
+
+    results = collect("Running code", func, _days, jobs, ticks, on_result=record, **timing)
+    if report is not None:
+        report.close()
+
+    save_timings({f"{day}.part_{part}": r.median for day, parts in results.items() for part, r in parts.items() if r.ok})
+    append_history(HISTORY_FILE, [records[key] for key in sorted(records)])
+    regressions = sum(regressed for _, regressed in changes.values())
+
+    if report is None:
+        title = f"AOC 2023 - Timings\n({iterations:,} iterations, {warmup:,} warmup, gc {gc.value})"
+        counts = {
+            (day, part): (count_results[day][part], count_column(history, records[day, part], compare))
+            for day, part in records
+            if count
+        }
+        print_timings(title, results, memory_results, changes, phases, counts, usage, cache_results)
+
+    warn_stalled(results, stderr=report is not None)
+
+    if regressions:
+        message = f"[red]{regressions} part(s) slower than baseline by more than {threshold:.0%}[/red]"
+        Console(stderr=report is not None).print(message)
+        raise typer.Exit(1)
+
+
+def timing_record(  # noqa: PLR0913
+    record: HistoryRecord,
+    result: Timing,
+    memory: Memory | None,
+    counts: Counts | None,
+    history: list[HistoryRecord],
+    cache_stats: CacheStats | str | None = None,
+) -> dict[str, Any]:
+    from utils.report import python_version, status
+
+    baseline = find_baseline(history, record)
+    fields: dict[str, Any] = {
+        "day": record.day,
+        "part": record.part,
+        "status": status(record.error),
+        "error": record.error,
+        "iterations": record.iterations,
+        "min": record.min,
+        "median": record.median,
+        "mean": result.mean,
+        "p95": record.p95,
+        "stddev": record.stddev,
+        "outliers": result.outliers,
+        "parse": result.parse,
+        "warm": result.warm,
+        "warm_error": result.warm_error,
+        "gc_collections": result.gc_collections,
+        "gc_pause": result.gc_pause,
+        "busy": result.busy,
+        "change": change(baseline, record) if baseline is not None and record.ok else math.nan,
+        "input_hash": record.input_hash,
+        "commit": record.commit,
+        "timestamp": record.timestamp,
+        "python": python_version(),
+    }
+    # Every record gets the same keys, failed parts included, so csv reports keep a fixed header
+    usage = asdict(result.usage) if result.usage is not None else dict.fromkeys(Usage.__dataclass_fields__)
+    fields |= {f"rusage_{name}": value for name, value in usage.items()}
+    if memory is not None:
+        fields |= {"traced_peak": memory.traced_peak, "rss_peak": memory.rss_peak}
+    if counts is not None:
+        fields |= {"instructions": record.instructions, "calls": counts.calls, "lines": counts.lines}
+    if cache_stats is not None:
+        cached = asdict(cache_stats) if isinstance(cache_stats, CacheStats) else dict.fromkeys(CacheStats.__dataclass_fields__)
+        fields |= {f"cache_{name}": value for name, value in cached.items()}
+    return fields
+
+
+def count_cell(counts: Counts, field: str) -> str:
+    return f"{getattr(counts, field):,}" if counts.ok else f"[red]✗ {counts.error}[/red]"
+
+
+def cache_column(stats: CacheStats | str) -> str:
+    if isinstance(stats, str):
+        return f"[red]✗ {stats}[/red]"
+    if not stats.hits + stats.misses:
+        return "-"
+    return f"{stats.hits:,} / {stats.misses:,} / {stats.evictions:,} ({stats.hit_rate:.0%})"
+
+
+def print_timings(  # noqa: PLR0913
+    title: str,
+    results: dict[str, dict[int, Timing]],
+    memory_results: dict[str, dict[int, Memory]],
+    changes: dict[tuple[str, int], tuple[str, bool]],
+    phases: bool,
+    counts: dict[tuple[str, int], tuple[Counts, str]] = {},
+    usage: bool = False,
+    cache_results: dict[str, dict[int, CacheStats | str]] = {},
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    extras: list[Column] = []
+    if any(not math.isnan(r.parse) for parts in results.values() for r in parts.values()):
+        extras.append(("Parse", "right", lambda day, part: human_time(results[day][part].parse)))
+    if any(not math.isnan(r.warm) or r.warm_error for parts in results.values() for r in parts.values()):
+        extras.append(("Warm", "right", lambda day, part: warm_column(results[day][part])))
+    if any(not math.isnan(r.gc_pause) for parts in results.values() for r in parts.values()):
+        extras.append(("GC", "right", lambda day, part: gc_column(results[day][part])))
+    if usage:
+        extras.append(("CPU", "right", lambda day, part: usage_columns(results[day][part])[0]))
+        extras.append(("Ctx Switches", "right", lambda day, part: usage_columns(results[day][part])[1]))
+        extras.append(("Faults", "right", lambda day, part: usage_columns(results[day][part])[2]))
+    if phases:
+        extras.append(("Phases", "left", lambda day, part: phases_column(results[day][part])))
+    if memory_results:
+        extras.append(("Traced Peak", "right", lambda day, part: human_bytes(memory_results[day][part].traced_peak)))
+        extras.append(("Peak RSS", "right", lambda day, part: human_bytes(memory_results[day][part].rss_peak)))
+    if counts:
+        extras.append(("Instructions", "right", lambda day, part: counts[day, part][1]))
+        extras.append(("Calls", "right", lambda day, part: count_cell(counts[day, part][0], "calls")))
+        extras.append(("Lines", "right", lambda day, part: count_cell(counts[day, part][0], "lines")))
+    if cache_results:
+        extras.append(("Cache", "right", lambda day, part: cache_column(cache_results[day][part])))
+    if changes:
+        extras.append(("Change", "right", lambda day, part: changes[day, part][0]))
+
+    table = Table(title=title)
 
     table.add_column("Day", justify="center", style="bold")
-    table.add_column("Part 1", justify="right")
-    table.add_column("Part 2", justify="right")
+    table.add_column("Part", justify="center")
+    table.add_column("Min", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("P95", justify="right")
+    table.add_column("Std Dev", justify="right")
+    table.add_column("Outliers", justify="right")
+    for header, justify, _ in extras:
+        table.add_column(header, justify=justify)
 
-    if not days:
-        _days = [p.name.replace(".py", "") for p in list(Path("./src").glob("day_*.py"))]
-    else:
-        _days = [str(d) for d in days]
+    for day in sorted(results):
+        for part, result in sorted(results[day].items()):
+            columns = [column(day, part) for _, _, column in extras]
+            table.add_row(f"{day_from_name(day)}", f"{part}", *timing_columns(result), *columns)
 
-    with Progress(transient=True) as progress:
-        task = progress.add_task("Running code", total=(len(_days) * 2) * iterations)
-        for day in sorted(_days):
-            p1, p2 = time_it(day, iterations, lambda: progress.update(task, advance=1))
+    with Console() as console:
+        console.print(table)
+
+
+def benchmark_scaling(  # noqa: PLR0913
+    days: list[str],
+    iterations: int,
+    jobs: int,
+    steps: int,
+    factor: float,
+    tolerance: float,
+    limits: Limits,
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    modules = {day: import_module(day) for day in days}
+    days = [day for day, module in modules.items() if scalable(module)]
+    options: dict[str, Any] = {"steps": steps, "factor": factor, "iterations": iterations, "limits": limits}
+    results = collect("Scaling code", scale_it, days, jobs, **options)
+
+    exponents = {
+        (day, part): exponent_column(curve, modules[day].SCALING.expected(part), tolerance)
+        for day, parts in results.items()
+        for part, curve in parts.items()
+    }
+    worse = sum(flagged for _, flagged in exponents.values())
+
+    table = Table(title=f"AOC 2023 - Scaling\n({iterations:,} generated inputs per size, x{factor:g} per step)")
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column("Sizes", justify="right")
+    for step in range(steps):
+        table.add_column(f"x{factor**step:g}", justify="right")
+    table.add_column("Exponent", justify="right")
+    table.add_column("Expected", justify="right")
+
+    for day in sorted(results):
+        for part, curve in sorted(results[day].items()):
+            timings = [*map(human_time, curve.times), *[""] * (steps - len(curve.times))]
+            status = f"[red]✗ {curve.error}[/red]" if not curve.ok else exponents[day, part][0]
+            size_range = f"{curve.sizes[0]:,}-{curve.sizes[-1]:,}" if curve.sizes else "-"
+            expected = f"{modules[day].SCALING.expected(part):g}"
+            table.add_row(f"{day_from_name(day)}", f"{part}", size_range, *timings, status, expected)
+
+    with Console() as console:
+        console.print(table)
+        if skipped := sorted(set(modules) - set(days)):
+            console.print(f"No input generator for {', '.join(skipped)}")
+        if worse:
+            console.print(f"[red]{worse} part(s) scale worse than expected by more than {tolerance:g}[/red]")
+
+    if worse:
+        raise typer.Exit(1)
+
+
+def benchmark_variants(days: list[str], iterations: int, warmup: int, jobs: int) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    modules = {day: import_module(day) for day in days}
+    days = [day for day, module in modules.items() if has_variants(module)]
+    results = collect("Checking and timing variants", time_variants, days, jobs, iterations=iterations, warmup=warmup)
+    mismatches = sum(mismatch is not None for parts in results.values() for mismatch, _ in parts.values())
+
+    table = Table(title=f"AOC 2023 - Variants\n({iterations:,} iterations, {warmup:,} warmup)")
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column("Variant")
+    table.add_column("Min", justify="right")
+    table.add_column("Median", justify="right")
+    table.add_column("P95", justify="right")
+    table.add_column("Std Dev", justify="right")
+    table.add_column("Outliers", justify="right")
+    table.add_column("Speedup", justify="right")
+
+    for day in sorted(results):
+        for part, (mismatch, timings) in sorted(results[day].items()):
+            if mismatch is not None:
+                table.add_row(f"{day_from_name(day)}", f"{part}", "all", f"[red]✗ {mismatch}[/red]", *[""] * 5)
+                continue
+            baseline = timings["default"]
+            for name, result in timings.items():
+                speedup = f"{baseline.median / result.median:.2f}x" if result.ok and baseline.ok else "-"
+                table.add_row(f"{day_from_name(day)}", f"{part}", name, *timing_columns(result), speedup)
+
+    with Console() as console:
+        console.print(table)
+        if skipped := sorted(set(modules) - set(days)):
+            console.print(f"No variants registered for {', '.join(skipped)}")
+        if mismatches:
+            console.print(f"[red]{mismatches} part(s) have variants that disagree[/red]")
+
+    if mismatches:
+        raise typer.Exit(1)
 
-            _, d = day.split("_")
-            table.add_row(f"{int(d)}", f"{p1:.4f}s", f"{p2:.4f}s")
+
+def speedup_columns(ratio: float, low: float, high: float, threshold: float) -> tuple[str, str, bool]:
+    if math.isnan(ratio):
+        return "-", "-", False
+    interval = f"{low:.2f}x - {high:.2f}x"
+    if low > 1:
+        return f"[green]{ratio:.2f}x faster[/green]", interval, False
+    if high < 1:
+        return f"[red]{1 / ratio:.2f}x slower[/red]", interval, ratio < 1 / (1 + threshold)
+    return f"{ratio:.2f}x", interval, False
+
+
+def benchmark_against(days: list[str], rev: str, iterations: int, warmup: int, threshold: float) -> None:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+    from utils.revisions import RevisionError, Runner, alternate, resolve, worktree
+    from utils.stats import speedup
+
+    try:
+        commit = resolve(rev, SRC)
+    except RevisionError as e:
+        raise typer.BadParameter(str(e), param_hint="'--against'") from e
+
+    missing = sorted(day for day in days if not Path(input_path(day)).exists())
+    tasks = [(day, part) for day in sorted(set(days) - set(missing)) for part in [1, 2]]
+    results: dict[tuple[str, int], tuple[Timing, Timing, tuple[float, float, float]]] = {}
+    with worktree(commit, SRC) as tree, Progress(transient=True, console=Console(stderr=True)) as progress:
+        task = progress.add_task(f"Comparing against {commit}", total=len(tasks))
+        for day, part in tasks:
+            path = input_path(day)
+            with Runner(SRC, day, part, path) as ours, Runner(tree / "src", day, part, path) as theirs:
+                mine, other = alternate(ours, theirs, iterations, warmup)
+            results[day, part] = (
+                Timing.from_ns(mine, ours.error),
+                Timing.from_ns(other, theirs.error),
+                speedup(mine, other) if ours.error is None and theirs.error is None else (math.nan,) * 3,
+            )
+            progress.update(task, advance=1)
+
+    table = Table(title=f"AOC 2023 - Current vs {commit}\n({iterations:,} alternating iterations, {warmup:,} warmup)")
+
+    table.add_column("Day", justify="center", style="bold")
+    table.add_column("Part", justify="center")
+    table.add_column(commit, justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Speedup", justify="right")
+    table.add_column("95% CI", justify="right")
+
+    regressions = 0
+    for (day, part), (current, previous, interval) in sorted(results.items()):
+        change, ci, regressed = speedup_columns(*interval, threshold)
+        regressions += regressed
+        medians = [human_time(t.median) if t.ok else f"[red]✗ {t.error}[/red]" for t in (previous, current)]
+        table.add_row(f"{day_from_name(day)}", f"{part}", *medians, change, ci)
 
     with Console() as console:
         console.print(table)
+        if missing:
+            console.print(f"No input for {', '.join(missing)}")
+        if regressions:
+            console.print(f"[red]{regressions} part(s) slower than {commit} by more than {threshold:.0%}[/red]")
+
+    if regressions:
+        raise typer.Exit(1)
 
 
 @app.command()
-def profile(day: DayType, part: PartType, sort: SortType = SortType.CALLS) -> None:
+def profile(  # noqa: PLR0913
+    day: DayType,
+    part: PartType,
+    sort: SortType = SortType.CALLS,
+    iterations: int = 1,
+    output: Path | None = None,
+    format: ProfileFormat = ProfileFormat.PSTATS,
+    lines: bool = False,
+    top: int = 20,
+) -> None:
+    from cProfile import Profile
+    from pstats import Stats
+
+    from utils.profiling import export, summary
+    from utils.report import Report, python_version
+
     module = import_module(day)
     input_str = read_input(day)
 
+    if lines:
+        if output is not None and format.value not in {"json", "csv", "jsonl"}:
+            raise typer.BadParameter("--lines only writes json, csv or jsonl", param_hint="'--format'")
+        profile_lines(module, part, input_str, iterations, top, format, output)
+        return
+
     with Profile() as profile:
-        getattr(module, part)(input_str)
-        Stats(profile).strip_dirs().sort_stats(sort).print_stats()
+        for _ in range(iterations):
+            getattr(module, part)(input_str)
+
+    stats = Stats(profile)
+    if format.value in {"json", "csv", "jsonl"}:
+        record = {"day": day.value, "part": day_part(part), "status": "ok", "iterations": iterations, **summary(stats)}
+        record |= {"input_hash": input_hash(day.value), "python": python_version()}
+        with contextlib.ExitStack() as stack:
+            stream = stack.enter_context(output.open("w")) if output is not None else None
+            with Report(format.value, stream) as report:
+                report.write(record)
+        return
+
+    if output is not None:
+        export(stats, str(output), format, f"{day.value}.{part.value}")
+        print(f"Wrote {format.value} profile to {output}")
+        return
+
+    stats.strip_dirs().sort_stats(sort).print_stats()
 
 
-def run_day(day: str, progress: Callable[..., Any] = lambda: None) -> tuple[float, float]:
+def profile_lines(  # noqa: PLR0913
+    module: ModuleType,
+    part: PartType,
+    input_str: str,
+    iterations: int,
+    top: int,
+    format: ProfileFormat,
+    output: Path | None,
+) -> None:
+    import linecache
+
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
+    from utils.profiling import hottest_lines, line_profile
+    from utils.report import Report
+
+    filename = module.__file__ or ""
+    with line_profile(filename) as found:
+        for _ in range(iterations):
+            getattr(module, part)(input_str)
+
+    total = sum(stat.time for stat in found.values()) or 1
+    hottest: list[dict[str, Any]] = [
+        {
+            "day": module.__name__,
+            "part": day_part(part),
+            "line": line,
+            "hits": stat.hits,
+            "time": stat.time / NS_PER_SECOND,
+            "per_hit": stat.time / NS_PER_SECOND / stat.hits if stat.hits else math.nan,
+            "share": stat.time / total,
+            "source": linecache.getline(filename, line).strip(),
+        }
+        for line, stat in hottest_lines(found, top)
+    ]
+
+    if format.value in {"json", "csv", "jsonl"}:
+        with contextlib.ExitStack() as stack:
+            stream = stack.enter_context(output.open("w")) if output is not None else None
+            with Report(format.value, stream) as report:
+                for record in hottest:
+                    report.write(record)
+        return
+
+    table = Table(title=f"AOC 2023 - Hottest lines in {module.__name__}.{part.value}\n({iterations:,} iterations)")
+    table.add_column("Line", justify="right", style="bold", no_wrap=True)
+    table.add_column("Hits", justify="right", no_wrap=True)
+    table.add_column("Time", justify="right", no_wrap=True)
+    table.add_column("Per Hit", justify="right", no_wrap=True)
+    table.add_column("% Time", justify="right", no_wrap=True)
+    # Source is the only column that can shrink, and cuts long lines off instead of wrapping them
+    table.add_column("Source", justify="left")
+    for record in hottest:
+        table.add_row(
+            f"{record['line']}",
+            f"{record['hits']:,}",
+            human_time(record["time"]),
+            human_time(record["per_hit"]),
+            f"{record['share']:.1%}",
+            Text(record["source"], no_wrap=True, overflow="ellipsis"),
+        )
+
+    with Console() as console:
+        console.print(table)
+
+
+def answer_key(day: str, part: int) -> str:
+    spec = find_spec(day)
+    if spec is None or spec.origin is None:
+        raise ModuleNotFoundError(day)
+    return cache_key(file_hash(spec.origin), file_hash(input_path(day)), part)
+
+
+def solve_part(day: str, part: int) -> Any:
     module = import_module(day)
     input_str = read_input(day)
+    solver, _ = prepare(module, part, input_str)
+    return solver()
 
-    part_1 = 0
-    part_2 = 0
-    with contextlib.suppress(Exception):
-        part_1 = module.part_1(input_str)
-        progress()
 
-        part_2 = module.part_2(input_str)
-        progress()
+def run_day(day: str, part: int, cache: bool = True, limits: Limits = NO_LIMITS) -> Outcome:
+    answers = DiskCache(ANSWERS_CACHE)
+    try:
+        key = answer_key(day, part)
+    except FileNotFoundError as e:
+        return Outcome("error", error=f"FileNotFoundError: {e}")
+    if cache and key in answers:
+        with contextlib.suppress(KeyError):
+            return Outcome("ok", answers[key])
+
+    outcome = run_limited(solve_part, day, part, limits=limits) if limits.active else run_inline(solve_part, day, part)
 
-    return part_1, part_2
+    if outcome.ok:
+        with contextlib.suppress(TypeError):
+            answers[key] = outcome.value
+    return outcome
+
+
+def answer_record(day: str, part: int, outcome: Outcome) -> dict[str, Any]:
+    from utils.report import python_version
+
+    return {
+        "day": day,
+        "part": part,
+        "status": outcome.status,
+        "error": outcome.error,
+        "answer": outcome.value,
+        "wall": outcome.wall,
+        "input_hash": input_hash(day),
+        "python": python_version(),
+    }
+
+
+def answer_column(outcome: Outcome) -> str:
+    if outcome.ok:
+        return f"{outcome.value}"
+    return f"[red]✗ {outcome.status}[/red]"
 
 
 def day_from_name(file_name: str) -> int:
     return int(file_name.replace(".py", "").replace("day_", ""))
 
 
+def day_part(part: PartType) -> int:
+    return int(part.value.removeprefix("part_"))
+
+
 @app.command()
-def answers(days: list[int] = []) -> None:
+def answers(  # noqa: PLR0913
+    days: list[int] = [],
+    jobs: int = 1,
+    cache: bool = True,
+    timeout: float | None = None,
+    cpu_limit: float | None = None,
+    memory_limit: int | None = None,
+    format: OutputFormat = OutputFormat.TABLE,
+) -> None:
+    from rich.console import Console
+    from rich.table import Table
+    from utils.report import Report
+
+    if not days:
+        days = [day_from_name(p.name) for p in list(Path("./src").glob("day_*.py"))]
+
+    limits = make_limits(timeout, cpu_limit, memory_limit)
+    _days = [f"day_{d:02}" for d in days]
+    if format is not OutputFormat.TABLE:
+        with Report(format.value) as report:
+
+            def write(day: str, part: int, outcome: Outcome) -> None:
+                report.write(answer_record(day, part, outcome))
+
+            collect("Running code", run_day, _days, jobs, on_result=write, cache=cache, limits=limits)
+        return
+
+    results = collect("Running code", run_day, _days, jobs, cache=cache, limits=limits)
+
     table = Table(title="Advent of Code 2023 - Answers")
 
     table.add_column("Day", justify="center", style="bold")
     table.add_column("Part 1", justify="left")
     table.add_column("Part 2", justify="left")
 
+    for day in sorted(results):
+        table.add_row(f"{day_from_name(day)}", *(answer_column(results[day][part]) for part in [1, 2]))
+
+    with Console() as console:
+        console.print(table)
+
+
+@app.command("solve-many")
+def solve_inputs(day: DayType, files: list[Path], parts: list[int] = [1, 2], jobs: int = 1) -> None:
+    from rich.console import Console
+    from utils.batch import solve_many
+
+    inputs = (file.read_text().rstrip() for file in files)
+    with Console() as console:
+        for file, answers in zip(files, solve_many(day.value, inputs, tuple(parts), jobs)):
+            console.print(f"[bold]{file}[/bold]", *(answer_column(answers[part]) for part in parts))
+
+
+@app.command()
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8023,
+    socket: Path | None = None,
+    workers: int = 1,
+    timeout: float = 30,
+) -> None:
+    import asyncio
+
+    from utils.service import SolverService
+    from utils.service import serve as run_server
+
+    days = sorted(p.stem for p in SRC.glob("day_*.py"))
+    service = SolverService(days, workers, timeout)
+    print(f"Serving {len(days)} days with {workers} worker(s) on {socket or f'http://{host}:{port}'}")
+    try:
+        asyncio.run(run_server(service, host, port, str(socket) if socket else None))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+def import_time(module: str, preload: list[str] = []) -> int:
+    code = "; ".join(f"import {name}" for name in [*preload, module])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name.rstrip() == f" {module}":
+            return int(cumulative) * 1_000
+    raise ValueError(f"No import time recorded for {module}")
+
+
+@app.command()
+def specialise(
+    day: DayType,
+    part: PartType,
+    iterations: int = 10,
+    output: Path | None = None,
+    dark: bool = False,
+) -> None:
+    import shutil
+    import tempfile
+
+    if find_spec("specialist") is None:
+        print("specialist is not installed, install the dev extras with: pip install -e .[dev]", file=sys.stderr)
+        raise typer.Exit(1)
+    if not Path(input_path(day.value)).exists():
+        raise typer.BadParameter(f"No input for {day.value}", param_hint="'DAY'")
+
+    output = output or Path(f"{day.value}.{part.value}.html")
+    code = f"from utils import read_input; from {day.value} import {part.value} as solve; input_str = read_input({day.value!r})"
+    code += f"\nfor _ in range({iterations}): solve(input_str)"
+    with tempfile.TemporaryDirectory() as tmp:
+        # -c ends specialist's own options, so --dark has to come before it
+        options = ["--output", tmp, "--targets", f"{day.value}.py", *(["--dark"] if dark else [])]
+        result = subprocess.run([sys.executable, "-m", "specialist", *options, "-c", code], cwd=SRC, check=False)
+        report = Path(tmp) / f"{day.value}.html"
+        if result.returncode or not report.exists():
+            raise typer.Exit(result.returncode or 1)
+        shutil.move(report, output)
+
+    print(f"Wrote specialisation report for {day.value}.{part.value} to {output}")
+    print("Green code was specialised, red code stayed generic or de-optimised")
+
+
+@app.command()
+def startup(repeat: int = 5, days: list[str] = []) -> None:
+    from rich.console import Console
+    from rich.progress import Progress
+    from rich.table import Table
+
+    table = Table(title=f"AOC 2023 - Import Times\n({repeat:,} cold imports each)")
+
+    table.add_column("Module", style="bold")
+    table.add_column("Min", justify="right")
+    table.add_column("Median", justify="right")
+
     if not days:
-        days = [day_from_name(p.name) for p in list(Path("./src").glob("day_*.py"))]
+        days = sorted(p.name.replace(".py", "") for p in SRC.glob("day_*.py"))
 
-    with Progress(transient=True) as progress:
-        task = progress.add_task("Running code", total=(len(days) * 2))
-        for d in sorted(days):
-            p1, p2 = run_day(f"day_{d:02}", lambda: progress.update(task, advance=1))
+    modules: list[tuple[str, list[str]]] = [("aoc", []), ("utils", [])]
+    modules.extend((day, ["utils"]) for day in days)
 
-            table.add_row(f"{int(d)}", f"{p1}", f"{p2}")
+    with Progress(transient=True) as progress:
+        task = progress.add_task("Importing", total=len(modules) * repeat)
+        for module, preload in modules:
+            times: list[int] = []
+            for _ in range(repeat):
+                times.append(import_time(module, preload))
+                progress.update(task, advance=1)
+            timing = Timing.from_ns(times)
+            table.add_row(module, human_time(timing.min), human_time(timing.median))
 
     with Console() as console:
         console.print(table)
+        console.print("Day modules are imported after utils, so their times exclude the shared utils import")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,6 @@
+# First Party
+from utils.budgets import pytest_configure, pytest_runtest_makereport, pytest_terminal_summary
+
+pytest_plugins = ["pytester"]
+
+__all__ = ["pytest_configure", "pytest_runtest_makereport", "pytest_terminal_summary"]
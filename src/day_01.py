@@ -1,9 +1,11 @@
 # Standard Library
 import re
 from collections.abc import Generator
+from random import Random
+from string import ascii_lowercase, digits
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 
 def part_1(input: str) -> int:
@@ -30,6 +32,20 @@ def part_2(input: str) -> int:
     return sum(calibrations())
 
 
+SCALING = Scaling(base=1000, part_1=1, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    words = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+    lines: list[str] = []
+    for _ in range(size):
+        pieces = rng.choices([*ascii_lowercase, *digits[1:], *words], k=rng.randint(3, 12))
+        pieces.insert(rng.randint(0, len(pieces)), rng.choice(digits[1:]))
+        lines.append("".join(pieces))
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -60,6 +76,13 @@ def test_part_2() -> None:
     assert part_2(test_input) == 281
 
 
+def test_generate() -> None:
+    lines = generate(50, seed=1)
+    assert len(lines.splitlines()) == 50
+    assert part_1(lines) > 0
+    assert part_2(lines) > 0
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
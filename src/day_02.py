@@ -2,9 +2,10 @@
 from collections import defaultdict
 from collections.abc import Iterable
 from dataclasses import dataclass
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 
 @dataclass(frozen=True)
@@ -60,6 +61,21 @@ def part_2(input: str) -> int:
     return sum(g.power for g in games)
 
 
+SCALING = Scaling(base=1000, part_1=1, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    lines: list[str] = []
+    for id in range(1, size + 1):
+        rounds: list[str] = []
+        for _ in range(rng.randint(1, 6)):
+            colours = rng.sample(["red", "green", "blue"], 3)
+            rounds.append(", ".join(f"{rng.randint(1, 20)} {colour}" for colour in colours))
+        lines.append(f"Game {id}: {'; '.join(rounds)}")
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -81,6 +97,13 @@ def test_part_2() -> None:
     assert part_2(test_input) == 2286
 
 
+def test_generate() -> None:
+    games = generate(50, seed=1)
+    assert len(games.splitlines()) == 50
+    assert part_1(games) <= sum(range(1, 51))
+    assert part_2(games) > 0
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
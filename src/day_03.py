@@ -3,10 +3,11 @@ from collections import defaultdict, deque
 from collections.abc import Iterable
 from functools import reduce
 from itertools import count, product, takewhile
+from random import Random
 from typing import Self
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 
 class Grid:
@@ -101,6 +102,26 @@ def part_2(input: str) -> int:
     return ratio
 
 
+SCALING = Scaling(base=32, part_1=2, part_2=2)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    rows: list[str] = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            roll = rng.random()
+            if roll < 0.15:
+                row += f"{rng.randint(1, 999)}."
+            elif roll < 0.2:
+                row += rng.choice("*#+$/=%@&-")
+            else:
+                row += "."
+        rows.append(row[:size])
+    return "\n".join(rows)
+
+
 # -- Tests
 
 
@@ -128,6 +149,12 @@ def test_part_2() -> None:
     assert part_2(test_input) == 467835
 
 
+def test_generate() -> None:
+    schematic = generate(20, seed=1)
+    assert [len(row) for row in schematic.splitlines()] == [20] * 20
+    assert part_1(schematic) > 0
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -3,10 +3,11 @@ import re
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from functools import lru_cache
+from random import Random
 from typing import Self
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 
 @dataclass(frozen=True)
@@ -52,6 +53,21 @@ def part_2(input: str) -> int:
     return sum(count_cards(card) for card in cards)
 
 
+SCALING = Scaling(base=200, part_1=1, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    lines: list[str] = []
+    for id in range(1, size + 1):
+        wins = min(rng.choice([0, 0, 0, 1, 2, 3, 4, 5]), size - id)
+        numbers = rng.sample(range(1, 100), 35 - wins)
+        winning, ours = numbers[:10], numbers[10:] + numbers[:wins]
+        rng.shuffle(ours)
+        lines.append(f"Card {id}: {' '.join(f'{n:2}' for n in winning)} | {' '.join(f'{n:2}' for n in ours)}")
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -74,6 +90,12 @@ def test_part_2() -> None:
     assert part_2(test_input) == 30
 
 
+def test_generate() -> None:
+    cards = generate(50, seed=1)
+    assert len(cards.splitlines()) == 50
+    assert part_2(cards) >= 50
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
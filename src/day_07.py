@@ -4,10 +4,11 @@ from collections.abc import Generator
 from dataclasses import dataclass
 from functools import cached_property, lru_cache, total_ordering
 from itertools import chain
+from random import Random
 from typing import Self
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 
 @total_ordering
@@ -49,14 +50,21 @@ class Hand:
             scores = {str(v): k + 2 for k, v in enumerate(chain(["J"], range(2, 10), ["T", "Q", "K", "A"]))}
         return "".join([f"{scores[card]:02}" for card in self.cards])
 
+    @cached_property
+    def rank(self) -> tuple[int, str]:
+        return self.score if not self.joker else self.best_score, self.tiebreak
+
     @lru_cache
     def __float__(self) -> float:
-        return float(f"{self.score if not self.joker else self.best_score}.{self.tiebreak}")
+        return float("{}.{}".format(*self.rank))
 
     def __len__(self):
         return len(self.cards)
 
     def __eq__(self, __value: object) -> bool:
+        # lru_cache compares equal hashes with __eq__, so comparing hands through float() would recurse
+        if isinstance(__value, self.__class__):
+            return self.rank == __value.rank
         return float(self) == __value
 
     def __le__(self, __value: object) -> bool:
@@ -93,6 +101,19 @@ def part_2(input: str) -> int:
     return sum(totals)
 
 
+SCALING = Scaling(base=1000, part_1=1, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    hands: set[str] = set()
+    while len(hands) < size:
+        hands.add("".join(rng.choices("23456789TJQKA", k=5)))
+    ordered = sorted(hands)
+    rng.shuffle(ordered)
+    return "\n".join(f"{hand} {rng.randint(1, 1000)}" for hand in ordered)
+
+
 # -- Tests
 
 
@@ -114,6 +135,19 @@ def test_part_2() -> None:
     assert part_2(test_input) == 5905
 
 
+def test_warm_caches() -> None:
+    test_input = get_example_input()
+    assert (part_1(test_input), part_1(test_input)) == (6440, 6440)
+    assert (part_2(test_input), part_2(test_input)) == (5905, 5905)
+
+
+def test_generate() -> None:
+    hands = generate(50, seed=1)
+    assert len(hands.splitlines()) == 50
+    assert part_1(hands) > 0
+    assert part_2(hands) > 0
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
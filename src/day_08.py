@@ -38,14 +38,14 @@ def get_solver(instructions: Insts, nodes: dict[str, Node], targets: list[str])
     return partial(solve, instructions=instructions, nodes=nodes, targets=targets)
 
 
-def part_1(input: str) -> int:
-    instructions, nodes = parse(input)
+def solve_1(parsed: tuple[Insts, dict[str, Node]]) -> int:
+    instructions, nodes = parsed
 
     return solve("AAA", ["ZZZ"], nodes, instructions)
 
 
-def part_2(input: str) -> int:
-    instructions, nodes = parse(input)
+def solve_2(parsed: tuple[Insts, dict[str, Node]]) -> int:
+    instructions, nodes = parsed
 
     starts = [n for n in nodes if n[-1] == "A"]
     targets = [n for n in nodes if n[-1] == "Z"]
@@ -54,6 +54,14 @@ def part_2(input: str) -> int:
     return lcm(*[solver(c) for c in starts])
 
 
+def part_1(input: str) -> int:
+    return solve_1(parse(input))
+
+
+def part_2(input: str) -> int:
+    return solve_2(parse(input))
+
+
 # -- Tests
 
 
@@ -1,9 +1,10 @@
 # Standard Library
 from collections import defaultdict
 from itertools import count
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 
 def extend(seq: list[int]) -> list[int]:
@@ -40,6 +41,19 @@ def part_2(input: str) -> int:
     return sum(answers)
 
 
+SCALING = Scaling(base=200, part_1=1, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    lines: list[str] = []
+    for _ in range(size):
+        coefficients = [rng.randint(-5, 5) for _ in range(rng.randint(1, 6))]
+        values = [sum(c * x**power for power, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -59,6 +73,13 @@ def test_part_2() -> None:
     assert part_2(test_input) == 2
 
 
+def test_generate() -> None:
+    sequences = [line.split() for line in generate(50, seed=1).splitlines()]
+    truncated = "\n".join(" ".join(values[1:-1]) for values in sequences)
+    assert part_1(truncated) == sum(int(values[-1]) for values in sequences)
+    assert part_2(truncated) == sum(int(values[0]) for values in sequences)
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
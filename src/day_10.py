@@ -100,7 +100,7 @@ def build_path(pipe_map: dict[tuple[int, int], str], start: tuple[int, int]) ->
     return path
 
 
-def part_1(input: str) -> int:
+def parse(input: str) -> tuple[dict[tuple[int, int], str], tuple[int, int]]:
     start = 0, 0
     pipe_map: dict[tuple[int, int], str] = defaultdict(lambda: ".")
     for y, line in enumerate(input.splitlines()):
@@ -109,7 +109,11 @@ def part_1(input: str) -> int:
             if char == "S":
                 start = x, y
 
-    path = build_path(pipe_map, start)
+    return pipe_map, start
+
+
+def solve_1(parsed: tuple[dict[tuple[int, int], str], tuple[int, int]]) -> int:
+    path = build_path(*parsed)
     return len(path) // 2
 
 
@@ -120,21 +124,21 @@ def path_length(path: list[tuple[int, int]]) -> float:
     return abs(length) / 2
 
 
-def part_2(input: str) -> int:
-    start = 0, 0
-    pipe_map: dict[tuple[int, int], str] = defaultdict(lambda: ".")
-    for y, line in enumerate(input.splitlines()):
-        for x, char in enumerate(line):
-            pipe_map[x, y] = char
-            if char == "S":
-                start = x, y
-
-    path = build_path(pipe_map, start)
+def solve_2(parsed: tuple[dict[tuple[int, int], str], tuple[int, int]]) -> int:
+    path = build_path(*parsed)
     internal_area = path_length(path)
 
     return int(internal_area + 1 - (len(path) / 2))
 
 
+def part_1(input: str) -> int:
+    return solve_1(parse(input))
+
+
+def part_2(input: str) -> int:
+    return solve_2(parse(input))
+
+
 # -- Tests
 
 
@@ -1,10 +1,12 @@
 # Standard Library
+import math
 import re
 from collections import defaultdict
 from itertools import combinations
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input, variant
 
 Point = tuple[int, int]
 
@@ -73,6 +75,41 @@ def part_2(input: str, expansion: int = 1_000_000) -> int:
     return distance
 
 
+def spread(coords: list[int], expansion: int) -> int:
+    occupied = set(coords)
+    shift = 0
+    shifted: dict[int, int] = {}
+    for coord in range(max(coords) + 1):
+        if coord not in occupied:
+            shift += expansion - 1
+        shifted[coord] = coord + shift
+
+    expanded = sorted(shifted[coord] for coord in coords)
+    return sum(value * (2 * i - len(expanded) + 1) for i, value in enumerate(expanded))
+
+
+@variant(2, "sorted")
+def part_2_sorted(input: str, expansion: int = 1_000_000) -> int:
+    galaxies = [(x, y) for y, line in enumerate(input.splitlines()) for x, char in enumerate(line) if char == "#"]
+    xs, ys = zip(*galaxies)
+    return spread(list(xs), expansion) + spread(list(ys), expansion)
+
+
+@variant(1, "sorted")
+def part_1_sorted(input: str) -> int:
+    return part_2_sorted(input, 2)
+
+
+SCALING = Scaling(base=50, part_1=2, part_2=2)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    side = max(math.isqrt(45 * size), 2)
+    galaxies = set(rng.sample(range(side * side), max(size, 2)))
+    return "\n".join("".join("#" if y * side + x in galaxies else "." for x in range(side)) for y in range(side))
+
+
 # -- Tests
 
 
@@ -113,6 +150,19 @@ def test_part_2() -> None:
     assert part_2(test_input, 100) == 8410
 
 
+def test_sorted() -> None:
+    test_input = get_example_input()
+    assert part_1_sorted(test_input) == 374
+    assert part_2_sorted(test_input, 10) == 1030
+    assert part_2_sorted(test_input, 100) == 8410
+
+
+def test_generate() -> None:
+    sky = generate(20, seed=1)
+    assert sky.count("#") == 20
+    assert part_1(sky) == part_2(sky, 2)
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
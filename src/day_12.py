@@ -1,9 +1,11 @@
 # Standard Library
 import re
 from functools import lru_cache
+from itertools import groupby
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input
 
 no_more = re.compile(r"^\.*#\.*")
 match_chunk = re.compile(r"^\.*#+|^\.*\?")
@@ -51,6 +53,22 @@ def part_2(input: str) -> int:
     return posibles
 
 
+SCALING = Scaling(base=3, part_1=2, part_2=2)
+
+
+def generate(size: int, seed: int = 0, rows: int = 20) -> str:
+    rng = Random(seed)
+    lines: list[str] = []
+    for _ in range(rows):
+        springs = [rng.choice("#.") for _ in range(2 * size)]
+        springs[rng.randrange(len(springs))] = "#"
+        groups = [len(list(run)) for char, run in groupby(springs) if char == "#"]
+        for i in rng.sample(range(len(springs)), size):
+            springs[i] = "?"
+        lines.append(f"{''.join(springs)} {','.join(map(str, groups))}")
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -73,6 +91,12 @@ def test_part_2() -> None:
     assert part_2(test_input) == 525152
 
 
+def test_generate() -> None:
+    rows = generate(6, seed=1, rows=10)
+    assert all(row.split()[0].count("?") == 6 for row in rows.splitlines())
+    assert part_1(rows) >= 10
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
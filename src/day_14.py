@@ -2,11 +2,13 @@
 from collections import defaultdict
 from collections.abc import Iterable
 from functools import lru_cache
+from random import Random
 
 # First Party
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input, span
 
 
+@span("parse")
 def parse(input: str) -> tuple[dict[tuple[int, int], str], int, int]:
     platform: dict[tuple[int, int], str] = defaultdict(lambda: "!")
     for y, row in enumerate(input.splitlines()):
@@ -21,6 +23,7 @@ def _range(inc: int, size: int) -> Iterable[int]:
     return range(size, -1, -1) if inc == 1 else range(size)
 
 
+@span("roll")
 def roll(platform: dict[tuple[int, int], str], dir: tuple[int, int], width: int, height: int) -> dict[tuple[int, int], str]:
     for y in _range(dir[1], height):
         for x in _range(dir[0], width):
@@ -63,10 +66,10 @@ def cycles(platform: dict[tuple[int, int], str], rounds: int, width: int, height
             cache[platform_hash] = i
         else:
             cycle = i - cache[platform_hash]
-            idx = cache[platform_hash] + (rounds - cache[platform_hash]) % cycle
+            idx = cache[platform_hash] + (rounds - 1 - cache[platform_hash]) % cycle
             search_hash = ""
             for item in cache.items():
-                if item[1] == idx - 1:
+                if item[1] == idx:
                     search_hash = item[0]
             while hash_platform(platform) != search_hash:
                 platform = roll_dirs(platform)
@@ -85,6 +88,14 @@ def part_2(input: str, rounds: int = 1_000_000_000) -> int:
     return weight
 
 
+SCALING = Scaling(base=8, part_1=2, part_2=3)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "\n".join("".join(rng.choices(".O#", weights=[6, 3, 1], k=size)) for _ in range(size))
+
+
 # -- Tests
 
 
@@ -151,6 +162,16 @@ def test_part_2_3_rounds():
     assert part_2(test_input, 3) == 69
 
 
+def test_generate() -> None:
+    platform = generate(12, seed=1)
+    assert [len(row) for row in platform.splitlines()] == [12] * 12
+    assert part_1(platform) >= part_2(platform, 0)
+
+
+def test_part_2_settled_platform() -> None:
+    assert part_2("O.\n..") == 1
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -2,9 +2,11 @@
 import re
 from collections import OrderedDict, defaultdict
 from functools import reduce
+from random import Random
+from string import ascii_lowercase
 
 # First Party
-from utils import CachingDict, no_input_skip, read_input
+from utils import CachingDict, Scaling, no_input_skip, read_input
 
 
 def hash_algo(input: str) -> int:
@@ -35,6 +37,16 @@ def part_2(input: str) -> int:
     return power
 
 
+SCALING = Scaling(base=4000, part_1=1, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    labels = ["".join(rng.choices(ascii_lowercase, k=rng.randint(2, 6))) for _ in range(max(size // 4, 1))]
+    steps = [f"{rng.choice(labels)}{rng.choice(['-', f'={rng.randint(1, 9)}'])}" for _ in range(size)]
+    return ",".join(steps)
+
+
 # -- Tests
 
 
@@ -56,6 +68,12 @@ def test_part_2() -> None:
     assert part_2(test_input) == 145
 
 
+def test_generate() -> None:
+    steps = generate(100, seed=1)
+    assert len(steps.split(",")) == 100
+    assert part_1(steps) == sum(hash_algo(step) for step in steps.split(","))
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -1,6 +1,7 @@
 from collections import deque
+from random import Random
 
-from utils import no_input_skip, read_input
+from utils import Scaling, no_input_skip, read_input, span
 
 Vec2 = tuple[int, int]
 
@@ -20,6 +21,7 @@ mirror_map_bs = {UP: LEFT, LEFT: UP, DOWN: RIGHT, RIGHT: DOWN}
 Beam = tuple[Vec2, Vec2]
 
 
+@span("energize")
 def energize(start: Vec2, direction: Vec2, grid: dict[Vec2, str]) -> int:
     energized: set[Vec2] = set()
     history: set[tuple[Vec2, Vec2]] = set()
@@ -51,21 +53,19 @@ def energize(start: Vec2, direction: Vec2, grid: dict[Vec2, str]) -> int:
     return len(energized)
 
 
-def part_1(puzzle: str) -> int:
+def parse(puzzle: str) -> dict[Vec2, str]:
     grid: dict[Vec2, str] = {}
     for y, line in enumerate(puzzle.splitlines()):
         for x, c in enumerate(line):
             grid[x, y] = c
+    return grid
 
-    return energize((0, 0), RIGHT, grid)
 
+def solve_1(grid: dict[Vec2, str]) -> int:
+    return energize((0, 0), RIGHT, grid)
 
-def part_2(puzzle: str) -> int:
-    grid: dict[Vec2, str] = {}
-    for y, line in enumerate(puzzle.splitlines()):
-        for x, c in enumerate(line):
-            grid[x, y] = c
 
+def solve_2(grid: dict[Vec2, str]) -> int:
     starts: list[tuple[Vec2, Vec2]] = []
     max_x, max_y = max(grid)
     starts.extend([((x, 0), DOWN) for x in range(max_x)])
@@ -76,6 +76,22 @@ def part_2(puzzle: str) -> int:
     return max([energize(start, direction, grid) for start, direction in starts])
 
 
+def part_1(puzzle: str) -> int:
+    return solve_1(parse(puzzle))
+
+
+def part_2(puzzle: str) -> int:
+    return solve_2(parse(puzzle))
+
+
+SCALING = Scaling(base=8, part_1=2, part_2=3)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    return "\n".join("".join(rng.choices(".|-/\\", weights=[90, 2, 2, 3, 3], k=size)) for _ in range(size))
+
+
 # -- Tests
 
 
@@ -102,6 +118,12 @@ def test_part_2() -> None:
     assert part_2(test_input) == 51
 
 
+def test_generate() -> None:
+    grid = generate(12, seed=1)
+    assert [len(row) for row in grid.splitlines()] == [12] * 12
+    assert 0 < part_1(grid) <= part_2(grid) <= 144
+
+
 @no_input_skip
 def test_part_1_real() -> None:
     real_input = read_input(__file__)
@@ -2,7 +2,7 @@
 import heapq
 from typing import NamedTuple
 
-from utils import draw_grid, read_input, time_limit
+from utils import Limits, draw_grid, read_input, run_limited
 
 Vec2 = tuple[int, int]
 Grid = dict[Vec2, int]
@@ -108,8 +108,9 @@ def get_example_input() -> str:
 
 def test_part_1() -> None:
     test_input = get_example_input()
-    with time_limit(5):
-        assert part_1(test_input) == 102
+    outcome = run_limited(part_1, test_input, limits=Limits(wall=5))
+    assert outcome.ok, outcome.error
+    assert outcome.value == 102
 
 
 # def test_part_2() -> None:
@@ -120,8 +121,8 @@ def test_part_1() -> None:
 # @no_input_skip
 # def test_part_1_real() -> None:
 #    real_input = read_input(__file__)
-#    with time_limit(10):
-#        assert part_1(real_input) > 837
+#    outcome = run_limited(part_1, real_input, limits=Limits(wall=10))
+#    assert outcome.value > 837
 
 
 # @no_input_skip
@@ -1,8 +1,9 @@
 import re
 from collections import Counter, defaultdict, deque
 from itertools import pairwise
+from random import Random
 
-from utils import no_input_skip, read_input, time_limit
+from utils import Limits, Scaling, no_input_skip, read_input, run_limited
 
 Vec2 = tuple[int, int]
 
@@ -92,6 +93,23 @@ def part_2(puzzle: str) -> int:
     return internal_area(path) + length // 2 + 1
 
 
+SCALING = Scaling(base=10, part_1=2, part_2=1)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    rng = Random(seed)
+    limit = 0xFFFFF // size
+    steps = [(rng.randint(2, 10), rng.randint(2, 10), rng.randint(1, limit), rng.randint(1, limit)) for _ in range(size)]
+    lines: list[str] = []
+    for right, down, colour_right, colour_down in steps:
+        lines.append(f"R {right} (#{colour_right:05x}0)")
+        lines.append(f"D {down} (#{colour_down:05x}1)")
+    totals = [sum(column) for column in zip(*steps)]
+    lines.append(f"L {totals[0]} (#{totals[2]:05x}2)")
+    lines.append(f"U {totals[1]} (#{totals[3]:05x}3)")
+    return "\n".join(lines)
+
+
 # -- Tests
 
 
@@ -119,8 +137,20 @@ def test_part_1():
 
 def test_part_2():
     test_input = get_example_input()
-    with time_limit(10):
-        assert part_2(test_input) == 952408144115
+    outcome = run_limited(part_2, test_input, limits=Limits(wall=10))
+    assert outcome.ok, outcome.error
+    assert outcome.value == 952408144115
+
+
+def test_generate() -> None:
+    plan = generate(5, seed=1)
+    assert len(plan.splitlines()) == 12
+
+    def encode(m: re.Match[str]) -> str:
+        direction: str = m.group(1)
+        return f"#{int(m.group(2)):05x}{'RDLU'.index(direction)}"
+
+    assert part_1(plan) == part_2(re.sub(r"(\w) (\d+) \(#\w+\)", encode, plan))
 
 
 @no_input_skip
@@ -5,7 +5,7 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Self
 
-from utils import no_input_skip, read_input
+from utils import no_input_skip, read_input, span
 
 Part = dict[str, int]
 
@@ -49,6 +49,7 @@ class Workflow:
         return cls(var, valid_ops[op], val, action, rest)
 
 
+@span("parse")
 def parse(puzzle: str) -> tuple[dict[str, Workflow], list[Part]]:
     raw_workflows, raw_parts = puzzle.split("\n\n")
 
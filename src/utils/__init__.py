@@ -1,16 +1,29 @@
 # First Party
-from utils.collections import CachingDict
+from utils.collections import CachingDict, LFUCachingDict, LRUCachingDict, TTLCachingDict
 from utils.contextmanagers import time_limit
 from utils.decorators import no_input_skip
-from utils.helpers import ocr, read_input
+from utils.execution import Limits, run_limited
+from utils.helpers import ocr, read_input, read_input_bytes
+from utils.scaling import Scaling
+from utils.spans import span
+from utils.variants import variant
 from utils.visualisers import GridType, draw_grid
 
 __all__ = [
     "read_input",
+    "read_input_bytes",
     "ocr",
     "no_input_skip",
     "draw_grid",
     "GridType",
     "CachingDict",
+    "LRUCachingDict",
+    "LFUCachingDict",
+    "TTLCachingDict",
     "time_limit",
+    "span",
+    "Limits",
+    "run_limited",
+    "Scaling",
+    "variant",
 ]
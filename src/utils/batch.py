@@ -0,0 +1,72 @@
+# Standard Library
+from collections import deque
+from collections.abc import Iterable, Iterator
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+# First Party
+from utils.execution import Outcome, run_inline
+from utils.solver import prepare, release
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+Answers = dict[int, Outcome]
+
+
+def _solve(module: ModuleType, part: int, input_str: str) -> Any:
+    solver, _ = prepare(module, part, input_str)
+    return solver()
+
+
+def solve_input(day: str, input_str: str, parts: tuple[int, ...] = (1, 2)) -> Answers:
+    module = import_module(day)
+    try:
+        return {part: run_inline(_solve, module, part, input_str) for part in parts}
+    finally:
+        release(module, input_str)
+
+
+def solve_many(day: str, inputs: Iterable[str], parts: tuple[int, ...] = (1, 2), jobs: int = 1) -> Iterator[Answers]:
+    import_module(day)
+    if jobs <= 1:
+        for input_str in inputs:
+            yield solve_input(day, input_str, parts)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    pending: deque[Future[Answers]] = deque()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=import_module, initargs=(day,)) as pool:
+        for input_str in inputs:
+            pending.append(pool.submit(solve_input, day, input_str, parts))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# --- tests
+
+
+def _values(answers: Iterable[Answers]) -> list[dict[int, Any]]:
+    return [{part: outcome.value for part, outcome in result.items()} for result in answers]
+
+
+def test_solve_input():
+    answers = solve_input("day_15", "rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7")
+    assert _values([answers]) == [{1: 1320, 2: 145}]
+
+
+def test_solve_input_error():
+    answers = solve_input("day_15", "HASH", parts=(1,))
+    assert answers[1].ok
+    assert not solve_input("day_11", "", parts=(2,))[2].ok
+
+
+def test_solve_many_keeps_order():
+    inputs = ["HASH", "rn=1", "cm-", "HASH,rn=1"]
+    expected = [{1: 52}, {1: 30}, {1: 253}, {1: 82}]
+    assert _values(solve_many("day_15", inputs, parts=(1,))) == expected
+    assert _values(solve_many("day_15", iter(inputs), parts=(1,), jobs=2)) == expected
@@ -0,0 +1,142 @@
+# Standard Library
+import re
+import tomllib
+from collections.abc import Generator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Self
+
+# Third Party
+import pytest
+
+REAL_TEST = re.compile(r"test_part_\d_real$")
+
+
+class BudgetWarning(pytest.PytestWarning):
+    pass
+
+
+@dataclass(frozen=True)
+class Budgets:
+    default: float | None = None
+    days: dict[str, float] = field(default_factory=dict)
+    action: str = "warn"
+
+    def budget(self, day: str) -> float | None:
+        return self.days.get(day, self.default)
+
+    @classmethod
+    def load(cls, path: Path) -> Self:
+        try:
+            with open(path, "rb") as f:
+                config = tomllib.load(f)
+        except FileNotFoundError:
+            return cls()
+        budget = config.get("tool", {}).get("aoc", {}).get("budget", {})
+        action = budget.get("action", "warn")
+        if action not in ("warn", "fail"):
+            raise ValueError(f"[tool.aoc.budget] action must be 'warn' or 'fail', not {action!r}")
+        return cls(budget.get("default"), budget.get("days", {}), action)
+
+
+budgets_key = pytest.StashKey[Budgets]()
+overruns_key = pytest.StashKey[list[str]]()
+
+
+def item_budget(item: pytest.Item) -> float | None:
+    if (marker := item.get_closest_marker("budget")) is not None:
+        return float(marker.args[0])
+    if REAL_TEST.search(item.name):
+        return item.config.stash[budgets_key].budget(item.path.stem)
+    return None
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line("markers", "budget(seconds): fail or warn when the test runs longer than this")
+    config.stash[budgets_key] = Budgets.load(config.rootpath / "pyproject.toml")
+    config.stash[overruns_key] = []
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, Any, pytest.TestReport]:
+    report: pytest.TestReport = yield
+    budget = item_budget(item)
+    if call.when != "call" or not report.passed or budget is None or call.duration <= budget:
+        return report
+
+    message = f"{item.nodeid} took {call.duration:.3f}s, over its {budget:g}s budget"
+    item.config.stash[overruns_key].append(message)
+    if item.config.stash[budgets_key].action == "fail":
+        report.outcome = "failed"
+        report.longrepr = message
+    else:
+        item.warn(BudgetWarning(message))
+    return report
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    if overruns := config.stash[overruns_key]:
+        terminalreporter.section("time budgets")
+        for message in overruns:
+            terminalreporter.line(message)
+
+
+# --- tests
+
+
+def test_budgets_load(tmp_path):
+    path = tmp_path / "pyproject.toml"
+    path.write_text('[tool.aoc.budget]\naction = "fail"\ndefault = 2\n\n[tool.aoc.budget.days]\nday_05 = 30\n')
+    budgets = Budgets.load(path)
+    assert budgets.action == "fail"
+    assert budgets.budget("day_05") == 30
+    assert budgets.budget("day_06") == 2
+
+
+def test_budgets_load_missing(tmp_path):
+    assert Budgets.load(tmp_path / "pyproject.toml") == Budgets()
+    assert Budgets().budget("day_01") is None
+
+
+def test_budgets_load_invalid_action(tmp_path):
+    path = tmp_path / "pyproject.toml"
+    path.write_text('[tool.aoc.budget]\naction = "explode"\n')
+    with pytest.raises(ValueError, match="explode"):
+        Budgets.load(path)
+
+
+def _run(pytester, path):
+    return pytester.runpytest("-p", "utils.budgets", "-W", "ignore::pytest.PytestAssertRewriteWarning", path)
+
+
+def test_budget_plugin(pytester):
+    pytester.makepyprojecttoml('[tool.aoc.budget]\naction = "fail"\n\n[tool.aoc.budget.days]\nday_31 = 0.05\n')
+    pytester.makepyfile(
+        day_31="""
+        import time
+        import pytest
+
+        def test_part_1_real():
+            pass
+
+        def test_part_2_real():
+            time.sleep(0.1)
+
+        def test_part_1():
+            time.sleep(0.1)
+
+        @pytest.mark.budget(0.01)
+        def test_marked():
+            time.sleep(0.05)
+        """,
+    )
+    result = _run(pytester, "day_31.py")
+    result.assert_outcomes(passed=2, failed=2)
+    result.stdout.fnmatch_lines(["*time budgets*", "*test_part_2_real took *s, over its 0.05s budget"])
+
+
+def test_budget_plugin_warns(pytester):
+    pytester.makepyprojecttoml("[tool.aoc.budget]\ndefault = 0.01\n")
+    pytester.makepyfile(day_32="import time\n\ndef test_part_1_real():\n    time.sleep(0.05)\n")
+    result = _run(pytester, "day_32.py")
+    result.assert_outcomes(passed=1, warnings=1)
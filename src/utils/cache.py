@@ -0,0 +1,68 @@
+# Standard Library
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def cache_key(*parts: str | int) -> str:
+    return hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+
+class DiskCache:
+    path: Path
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def __contains__(self, key: str) -> bool:
+        return self._file(key).exists()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            with open(self._file(key)) as f:
+                return json.load(f)["value"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError) as e:
+            raise KeyError(key) from e
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp = self._file(key).with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps({"value": value}))
+        os.replace(temp, self._file(key))
+
+    def clear(self) -> None:
+        for file in self.path.glob("*.json"):
+            file.unlink()
+
+
+# --- tests
+
+
+def test_cache_key():
+    assert cache_key("a", 1) == cache_key("a", 1)
+    assert cache_key("a", 1) != cache_key("a", 2)
+    assert cache_key("ab", "c") != cache_key("a", "bc")
+
+
+def test_disk_cache(tmp_path: Path):
+    cache = DiskCache(tmp_path / "cache")
+    assert "key" not in cache
+    cache["key"] = [1, "two", None]
+    assert "key" in cache
+    assert cache["key"] == [1, "two", None]
+    assert DiskCache(tmp_path / "cache")["key"] == [1, "two", None]
+    cache.clear()
+    assert "key" not in cache
+
+
+def test_disk_cache_missing(tmp_path: Path):
+    try:
+        DiskCache(tmp_path)["missing"]
+    except KeyError:
+        return
+    raise AssertionError("missing key should raise KeyError")
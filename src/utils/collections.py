@@ -1,23 +1,331 @@
 # Standard Library
-from collections.abc import Callable
-from typing import Generic, Self, TypeVar
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Generator, Iterator, MutableMapping
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass
+from typing import Any, Generic, Self, TypeVar
+from weakref import WeakValueDictionary
 
 K = TypeVar("K")
 T = TypeVar("T")
 
 
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __add__(self, other: Self) -> Self:
+        return type(self)(*(mine + theirs for mine, theirs in zip(astuple(self), astuple(other))))
+
+
+_recordings: list[list[CacheStats]] = []
+
+
+def _register(stats: CacheStats) -> CacheStats:
+    if _recordings:
+        _recordings[-1].append(stats)
+    return stats
+
+
+@contextmanager
+def recording_caches() -> Generator[list[CacheStats], None, None]:
+    found: list[CacheStats] = []
+    _recordings.append(found)
+    try:
+        yield found
+    finally:
+        _recordings.pop()
+
+
 class CachingDict(dict[K, T], Generic[K, T]):
     cache_factory: Callable[[K], T]
+    stats: CacheStats
+    counting: bool
 
     def __init__(self: Self, cache_factory: Callable[[K], T]) -> None:
         self.cache_factory = cache_factory
+        self.stats = _register(CacheStats())
+        # Misses are counted in __missing__ for free, hits only while a recording wants them
+        self.counting = bool(_recordings)
         super().__init__()
 
+    def __getitem__(self: Self, __key: K) -> T:
+        if self.counting and __key in self:
+            self.stats.hits += 1
+        return super().__getitem__(__key)
+
     def __missing__(self: Self, __key: K) -> T:
-        self.__setitem__(__key, self.cache_factory(__key))
-        return self[__key]
+        self.stats.misses += 1
+        value = self.cache_factory(__key)
+        self.__setitem__(__key, value)
+        return value
+
+
+class BoundedCachingDict(MutableMapping[K, T], ABC):
+    def __init__(self: Self, cache_factory: Callable[[K], T], maxsize: int | None = 128, weak: bool = False) -> None:
+        self.cache_factory = cache_factory
+        self.maxsize = maxsize
+        self.weak = weak
+        self.data: MutableMapping[K, T]
+        if weak:
+            self.data = WeakValueDictionary()
+        else:
+            self.data = {}
+        self.tracked: dict[K, Any] = {}
+        self.stats = _register(CacheStats())
+
+    def __getitem__(self: Self, __key: K) -> T:
+        try:
+            value = self.data[__key]
+        except KeyError:
+            pass
+        else:
+            if not self._expired(__key):
+                self.stats.hits += 1
+                self._touch(__key)
+                return value
+            self._discard(__key)
+
+        self.stats.misses += 1
+        value = self.cache_factory(__key)
+        self[__key] = value
+        return value
+
+    def __setitem__(self: Self, __key: K, value: T) -> None:
+        if __key not in self.data:
+            self._sweep()
+            while self.maxsize is not None and len(self.tracked) >= self.maxsize:
+                self._evict()
+        self.data[__key] = value
+        self._touch(__key)
+
+    def __delitem__(self: Self, __key: K) -> None:
+        del self.data[__key]
+        self._forget(__key)
+
+    # The mixin versions go through __getitem__, which would build and insert missing values
+    def __contains__(self: Self, __key: object) -> bool:
+        return __key in self.data and not self._expired(__key)  # type: ignore[arg-type]
+
+    def get(self: Self, __key: K, default: Any = None) -> Any:
+        return self.data[__key] if __key in self else default
+
+    def __iter__(self: Self) -> Iterator[K]:
+        return iter(self.data)
+
+    def __len__(self: Self) -> int:
+        return len(self.data)
+
+    def _discard(self: Self, __key: K) -> None:
+        # Weak values can disappear on their own, only entries still alive count as evictions
+        if __key in self.data:
+            del self.data[__key]
+            self.stats.evictions += 1
+        self._forget(__key)
+
+    def _evict(self: Self) -> None:
+        # Drop keys whose weak values are already gone before evicting live ones
+        if self.weak and (stale := [key for key in self.tracked if key not in self.data]):
+            for key in stale:
+                self._forget(key)
+            return
+        self._discard(self._victim())
+
+    def _expired(self: Self, __key: K) -> bool:
+        return False
+
+    def _sweep(self: Self) -> None:
+        pass
+
+    def _forget(self: Self, __key: K) -> None:
+        del self.tracked[__key]
+
+    @abstractmethod
+    def _touch(self: Self, __key: K) -> None:
+        ...
+
+    def _victim(self: Self) -> K:
+        return next(iter(self.tracked))
+
+
+class LRUCachingDict(BoundedCachingDict[K, T]):
+    def _touch(self: Self, __key: K) -> None:
+        self.tracked.pop(__key, None)
+        self.tracked[__key] = None
+
+
+class LFUCachingDict(BoundedCachingDict[K, T]):
+    def __init__(self: Self, cache_factory: Callable[[K], T], maxsize: int | None = 128, weak: bool = False) -> None:
+        super().__init__(cache_factory, maxsize, weak)
+        # Keys grouped by use count, each group oldest first, so the victim is found without a scan
+        self.uses: dict[int, dict[K, None]] = {}
+        self.fewest = 0
+
+    def _touch(self: Self, __key: K) -> None:
+        count = self.tracked.get(__key, 0)
+        if count:
+            self._ungroup(__key, count)
+        self.tracked[__key] = count + 1
+        self.uses.setdefault(count + 1, {})[__key] = None
+        if not count or self.fewest not in self.uses:
+            self.fewest = count + 1
+
+    def _forget(self: Self, __key: K) -> None:
+        self._ungroup(__key, self.tracked.pop(__key))
+
+    def _ungroup(self: Self, __key: K, count: int) -> None:
+        group = self.uses[count]
+        del group[__key]
+        if not group:
+            del self.uses[count]
+
+    def _victim(self: Self) -> K:
+        if self.fewest not in self.uses:
+            self.fewest = min(self.uses)
+        return next(iter(self.uses[self.fewest]))
+
+
+class TTLCachingDict(BoundedCachingDict[K, T]):
+    def __init__(  # noqa: PLR0913
+        self: Self,
+        cache_factory: Callable[[K], T],
+        ttl: float,
+        maxsize: int | None = None,
+        weak: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.clock = clock
+        super().__init__(cache_factory, maxsize, weak)
+
+    def _expired(self: Self, __key: K) -> bool:
+        return self.tracked[__key] <= self.clock()
+
+    def _sweep(self: Self) -> None:
+        # Keys are tracked in insertion order with a fixed ttl, so the expired ones are always at the front
+        now = self.clock()
+        while self.tracked and self.tracked[oldest := next(iter(self.tracked))] <= now:
+            self._discard(oldest)
+
+    def _touch(self: Self, __key: K) -> None:
+        self.tracked.setdefault(__key, self.clock() + self.ttl)
 
 
 def test_caching_dict() -> None:
     test_dict = CachingDict[str, str](lambda key: f"{key}-{key}")
     assert test_dict["test"] == "test-test"
+
+
+def test_caching_dict_recording() -> None:
+    with recording_caches() as found:
+        counted = CachingDict[str, int](len)
+        counted["abc"], counted["abc"], counted["de"]
+    plain = CachingDict[str, int](len)
+    plain["abc"], plain["abc"]
+
+    assert counted.counting
+    assert not plain.counting
+    assert found == [CacheStats(hits=1, misses=2)]
+    assert plain.stats == CacheStats(misses=1)
+
+
+def test_lru_caching_dict() -> None:
+    cache = LRUCachingDict[int, int](lambda key: key * 2, maxsize=2)
+    assert (cache[1], cache[2], cache[1], cache[3]) == (2, 4, 2, 6)
+    assert list(cache) == [1, 3]
+    assert cache.stats == CacheStats(hits=1, misses=3, evictions=1)
+
+
+def test_bounded_caching_dict_lookups() -> None:
+    now = [0.0]
+    for cache in (
+        LRUCachingDict[int, int](lambda key: key * 2, maxsize=2),
+        TTLCachingDict[int, int](lambda key: key * 2, ttl=10, maxsize=2, clock=lambda: now[0]),
+    ):
+        now[0] = 0
+        cache[1], cache[2]
+        assert 5 not in cache
+        assert cache.get(5) is None
+        assert cache.get(1) == 2
+        assert 1 in cache
+        assert sorted(cache) == [1, 2]
+        assert cache.stats == CacheStats(misses=2)
+
+    now[0] = 10
+    assert 1 not in cache
+    assert cache.get(1, -1) == -1
+
+
+def test_lfu_caching_dict() -> None:
+    cache = LFUCachingDict[int, int](lambda key: key * 2, maxsize=2)
+    for key in [1, 1, 2, 3, 3, 4]:
+        cache[key]
+    assert sorted(cache) == [3, 4]
+    assert cache.stats == CacheStats(hits=2, misses=4, evictions=2)
+
+    del cache[3]
+    cache[5], cache[5], cache[6]
+    assert sorted(cache) == [5, 6]
+    assert sorted(cache.uses) == [1, 2]
+
+
+def test_ttl_caching_dict() -> None:
+    now = [0.0]
+    cache = TTLCachingDict[str, int](len, ttl=10, clock=lambda: now[0])
+    cache["abc"]
+    now[0] = 5
+    cache["abc"]
+    now[0] = 11
+    cache["abc"]
+    assert cache.stats == CacheStats(hits=1, misses=2, evictions=1)
+
+    bounded = TTLCachingDict[int, int](abs, ttl=10, maxsize=1, clock=lambda: now[0])
+    bounded[1], bounded[2]
+    assert list(bounded) == [2]
+
+
+def test_ttl_caching_dict_sweeps():
+    now = [0.0]
+    cache = TTLCachingDict[int, int](abs, ttl=10, clock=lambda: now[0])
+    for key in range(100):
+        now[0] = key
+        cache[key]
+    assert len(cache) == len(cache.tracked) == 10
+    assert cache.stats.evictions == 90
+
+
+def test_bounded_caching_dict_is_abstract():
+    import pytest
+
+    with pytest.raises(TypeError, match="_touch"):
+        BoundedCachingDict(len)  # type: ignore[abstract]
+
+
+def test_weak_caching_dict() -> None:
+    class Box:
+        pass
+
+    cache = LRUCachingDict[int, Box](lambda _: Box(), maxsize=2, weak=True)
+    kept = cache[1]
+    cache[2]
+    assert list(cache) == [1]
+    cache[3]
+    cache[4]
+    assert cache[1] is kept
+    assert len(cache.tracked) <= 2
+    assert cache.stats.evictions == 0
+
+
+def test_cache_stats() -> None:
+    total = CacheStats(1, 2, 3) + CacheStats(1, 0, 0)
+    assert total == CacheStats(2, 2, 3)
+    assert total.hit_rate == 0.5
+    assert CacheStats().hit_rate == 0.0
@@ -0,0 +1,95 @@
+# Standard Library
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+monitoring = sys.monitoring
+EVENTS = monitoring.events.INSTRUCTION | monitoring.events.CALL | monitoring.events.LINE
+
+
+@dataclass(frozen=True)
+class Counts:
+    instructions: int = 0
+    calls: int = 0
+    lines: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def free_tool() -> int:
+    for tool in range(6):
+        if monitoring.get_tool(tool) is None:
+            return tool
+    raise RuntimeError("No free sys.monitoring tool id")
+
+
+def count(func: Callable[..., Any], *args: Any) -> Counts:
+    totals = {"instructions": 0, "calls": 0, "lines": 0}
+
+    def instruction(*_: Any) -> None:
+        totals["instructions"] += 1
+
+    def call(*_: Any) -> None:
+        totals["calls"] += 1
+
+    def line(*_: Any) -> None:
+        totals["lines"] += 1
+
+    tool = free_tool()
+    monitoring.use_tool_id(tool, "aoc-count")
+    monitoring.register_callback(tool, monitoring.events.INSTRUCTION, instruction)
+    monitoring.register_callback(tool, monitoring.events.CALL, call)
+    monitoring.register_callback(tool, monitoring.events.LINE, line)
+    error = None
+    try:
+        monitoring.set_events(tool, EVENTS)
+        func(*args)
+    except Exception as e:  # noqa: BLE001
+        error = type(e).__name__
+    finally:
+        monitoring.set_events(tool, monitoring.events.NO_EVENTS)
+        for event in (monitoring.events.INSTRUCTION, monitoring.events.CALL, monitoring.events.LINE):
+            monitoring.register_callback(tool, event, None)
+        monitoring.free_tool_id(tool)
+    return Counts(error=error, **totals)
+
+
+# --- tests
+
+
+def _work(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += abs(i)
+    return total
+
+
+def test_count_is_deterministic():
+    first, second = count(_work, 100), count(_work, 100)
+    assert first == second
+    assert first.ok
+    assert first.calls > 100
+    assert first.lines > 200
+    assert first.instructions > first.lines
+
+
+def test_count_scales_with_work():
+    small, large = count(_work, 10), count(_work, 1000)
+    assert large.instructions > small.instructions * 10
+    assert large.calls > small.calls
+
+
+def test_count_error():
+    counts = count(_work, "ten")
+    assert counts.error == "TypeError"
+    assert not counts.ok
+
+
+def test_count_frees_tool():
+    tools = [monitoring.get_tool(tool) for tool in range(6)]
+    count(_work, 10)
+    assert [monitoring.get_tool(tool) for tool in range(6)] == tools
@@ -3,9 +3,6 @@ from collections.abc import Callable
 from functools import wraps
 from typing import Any
 
-# Third Party
-import pytest
-
 
 def no_input_skip(f: Callable[..., Any]) -> Callable[..., Any]:
     @wraps(f)
@@ -13,6 +10,8 @@ def no_input_skip(f: Callable[..., Any]) -> Callable[..., Any]:
         try:
             return f(*args, **kwargs)
         except FileNotFoundError:
+            import pytest
+
             pytest.skip("Input file not found")
 
     return wrapper
@@ -0,0 +1,225 @@
+# Standard Library
+import math
+import multiprocessing
+import resource
+import signal
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import astuple, dataclass
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any, Literal, Self
+
+Status = Literal["ok", "timeout", "oom", "error"]
+
+
+@dataclass(frozen=True)
+class Limits:
+    wall: float | None = None
+    cpu: float | None = None
+    memory: int | None = None
+
+    @property
+    def active(self) -> bool:
+        return any(limit is not None for limit in [self.wall, self.cpu, self.memory])
+
+
+NO_LIMITS = Limits()
+
+
+@dataclass(frozen=True)
+class Outcome:
+    status: Status
+    value: Any = None
+    error: str | None = None
+    wall: float = math.nan
+    user: float = math.nan
+    system: float = math.nan
+    max_rss: float = math.nan
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+@dataclass(frozen=True)
+class Usage:
+    user: float = 0.0
+    system: float = 0.0
+    voluntary: int = 0
+    involuntary: int = 0
+    major_faults: int = 0
+    minor_faults: int = 0
+
+    @property
+    def cpu(self) -> float:
+        return self.user + self.system
+
+    def __add__(self, other: Self) -> Self:
+        return type(self)(*(mine + theirs for mine, theirs in zip(astuple(self), astuple(other))))
+
+    @classmethod
+    def between(cls, before: resource.struct_rusage, after: resource.struct_rusage) -> Self:
+        return cls(
+            after.ru_utime - before.ru_utime,
+            after.ru_stime - before.ru_stime,
+            after.ru_nvcsw - before.ru_nvcsw,
+            after.ru_nivcsw - before.ru_nivcsw,
+            after.ru_majflt - before.ru_majflt,
+            after.ru_minflt - before.ru_minflt,
+        )
+
+
+# Only the calling thread where supported, so progress bars and other threads are not counted
+RUSAGE_WHO = getattr(resource, "RUSAGE_THREAD", resource.RUSAGE_SELF)
+
+
+def thread_usage() -> resource.struct_rusage:
+    return resource.getrusage(RUSAGE_WHO)
+
+
+def max_rss(usage: resource.struct_rusage) -> int:
+    return usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+
+
+def run_inline(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Outcome:
+    before, peak = thread_usage(), resource.getrusage(resource.RUSAGE_SELF)
+    start = perf_counter()
+    try:
+        value = func(*args, **kwargs)
+        status: Status = "ok"
+        error = None
+    except MemoryError:
+        value, status, error = None, "oom", "MemoryError"
+    except Exception as e:  # noqa: BLE001
+        value, status, error = None, "error", f"{type(e).__name__}: {e}"
+    wall = perf_counter() - start
+
+    # Only what the call itself used, so inline and child process outcomes mean the same thing
+    spent = Usage.between(before, thread_usage())
+    grown = max_rss(resource.getrusage(resource.RUSAGE_SELF)) - max_rss(peak)
+    return Outcome(status, value, error, wall, spent.user, spent.system, grown)
+
+
+def _child(conn: Connection, func: Callable[..., Any], args: Any, kwargs: Any, limits: Limits) -> None:
+    if limits.cpu is not None:
+        seconds = math.ceil(limits.cpu)
+        resource.setrlimit(resource.RLIMIT_CPU, (seconds, seconds + 1))
+    if limits.memory is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (limits.memory, limits.memory))
+
+    outcome = run_inline(func, *args, **kwargs)
+    try:
+        conn.send(outcome)
+    except Exception as e:  # noqa: BLE001
+        conn.send(Outcome("error", None, f"Unable to return result: {e}", outcome.wall, outcome.user, outcome.system))
+    conn.close()
+
+
+def run_limited(func: Callable[..., Any], *args: Any, limits: Limits = NO_LIMITS, **kwargs: Any) -> Outcome:
+    # Callers are often inside a rich Progress, and forking while its thread runs can deadlock the child
+    context = multiprocessing.get_context("spawn")
+    receive, send = context.Pipe(duplex=False)
+    process = context.Process(target=_child, args=(send, func, args, kwargs, limits))
+
+    start = perf_counter()
+    process.start()
+    send.close()
+
+    if not receive.poll(limits.wall):
+        process.kill()
+        process.join()
+        return Outcome("timeout", error=f"Exceeded {limits.wall}s wall clock", wall=perf_counter() - start)
+
+    try:
+        outcome: Outcome = receive.recv()
+    except EOFError:
+        process.join()
+        wall = perf_counter() - start
+        if process.exitcode == -signal.SIGXCPU or (limits.cpu is not None and process.exitcode == -signal.SIGKILL):
+            return Outcome("timeout", error=f"Exceeded {limits.cpu}s CPU time", wall=wall)
+        if process.exitcode == -signal.SIGKILL:
+            return Outcome("oom", error="Killed", wall=wall)
+        return Outcome("error", error=f"Exited with code {process.exitcode}", wall=wall)
+
+    process.join()
+    return outcome
+
+
+# --- tests
+
+
+def _double(n: int) -> int:
+    return n * 2
+
+
+def _fail() -> None:
+    raise ValueError("nope")
+
+
+def _sleep(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def _spin() -> None:
+    while True:
+        pass
+
+
+def _allocate(size: int) -> int:
+    return len(bytearray(size))
+
+
+def test_limits_active():
+    assert not Limits().active
+    assert Limits(wall=1).active
+
+
+def test_usage_between():
+    before = thread_usage()
+    _allocate(64 * 1024 * 1024)
+    spent = Usage.between(before, thread_usage())
+    assert spent.cpu >= 0
+    assert spent.minor_faults > 0
+    assert (spent + spent).minor_faults == spent.minor_faults * 2
+    assert Usage() + Usage() == Usage()
+
+
+def test_run_inline():
+    outcome = run_inline(_double, 2)
+    assert outcome.ok
+    assert outcome.value == 4
+    assert outcome.wall >= 0
+    assert outcome.max_rss >= 0
+    assert run_inline(_fail).error == "ValueError: nope"
+
+
+def test_run_limited_ok():
+    outcome = run_limited(_double, 21, limits=Limits(wall=10))
+    assert outcome.ok
+    assert outcome.value == 42
+    assert outcome.max_rss >= 0
+    assert run_limited(_allocate, 256 * 1024**2).max_rss > 128 * 1024**2
+
+
+def test_run_limited_error():
+    outcome = run_limited(_fail)
+    assert outcome.status == "error"
+    assert outcome.error == "ValueError: nope"
+
+
+def test_run_limited_wall_timeout():
+    outcome = run_limited(_sleep, 10, limits=Limits(wall=0.2))
+    assert outcome.status == "timeout"
+    assert outcome.wall < 5
+
+
+def test_run_limited_cpu_timeout():
+    outcome = run_limited(_spin, limits=Limits(wall=10, cpu=1))
+    assert outcome.status == "timeout"
+
+
+def test_run_limited_memory():
+    outcome = run_limited(_allocate, 8 * 1024**3, limits=Limits(wall=10, memory=2 * 1024**3))
+    assert outcome.status == "oom"
@@ -0,0 +1,99 @@
+# Standard Library
+import gc
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Any
+
+MODES = ("on", "off", "freeze")
+
+
+@dataclass
+class GCStats:
+    collections: int = 0
+    pause: int = 0
+    collected: int = 0
+
+
+@contextmanager
+def watching(stats: GCStats) -> Generator[GCStats, None, None]:
+    started = 0
+
+    def callback(phase: str, info: dict[str, Any]) -> None:
+        nonlocal started
+        if phase == "start":
+            started = perf_counter_ns()
+        elif started:
+            stats.collections += 1
+            stats.pause += perf_counter_ns() - started
+            stats.collected += info["collected"]
+            started = 0
+
+    gc.callbacks.append(callback)
+    try:
+        yield stats
+    finally:
+        gc.callbacks.remove(callback)
+
+
+@contextmanager
+def gc_mode(mode: str) -> Generator[None, None, None]:
+    if mode not in MODES:
+        raise ValueError(f"Unknown gc mode {mode!r}")
+    if mode == "on":
+        yield
+        return
+
+    enabled = gc.isenabled()
+    if mode == "off":
+        gc.disable()
+    else:
+        gc.collect()
+        gc.freeze()
+    try:
+        yield
+    finally:
+        if mode == "freeze":
+            gc.unfreeze()
+        if enabled:
+            gc.enable()
+
+
+# --- tests
+
+
+def _cycles(n: int) -> None:
+    for _ in range(n):
+        node: list[Any] = []
+        node.append(node)
+
+
+def test_watching():
+    stats = GCStats()
+    with watching(stats):
+        gc.collect()
+        _cycles(1000)
+        gc.collect()
+    assert stats.collections >= 2
+    assert stats.collected >= 1000
+    assert stats.pause > 0
+    collections = stats.collections
+    gc.collect()
+    assert stats.collections == collections
+
+
+def test_gc_mode_off():
+    stats = GCStats()
+    with gc_mode("off"), watching(stats):
+        assert not gc.isenabled()
+        _cycles(100_000)
+    assert gc.isenabled()
+    assert stats.collections == 0
+
+
+def test_gc_mode_freeze():
+    with gc_mode("freeze"):
+        assert gc.get_freeze_count() > 0
+        assert gc.isenabled()
+    assert gc.get_freeze_count() == 0
@@ -1,12 +1,69 @@
 # Standard Library
+import hashlib
+import mmap
 import os
 from collections.abc import Iterable
 
 
-def read_input(day: str) -> str:
+def input_path(day: str) -> str:
     file = os.path.splitext(os.path.basename(day))[0]
-    with open(os.path.join(os.path.dirname(__file__), "..", "..", "inputs", f"{file}.txt")) as f:
-        return f.read().rstrip().rstrip("\n\r")
+    return os.path.join(os.path.dirname(__file__), "..", "..", "inputs", f"{file}.txt")
+
+
+MAX_MAPPED = 32
+WHITESPACE = b" \t\r\n\x0b\x0c"
+
+_mapped: dict[str, tuple[int, memoryview]] = {}
+_inputs: dict[str, tuple[int, str]] = {}
+
+
+def forget(path: str) -> None:
+    path = os.path.realpath(path)
+    # Views already handed out stay valid, the mapping closes once the last of them is collected
+    _inputs.pop(path, None)
+    _mapped.pop(path, None)
+
+
+def map_file(path: str) -> memoryview:
+    path = os.path.realpath(path)
+    mtime = os.stat(path).st_mtime_ns
+    if path in _mapped and _mapped[path][0] == mtime:
+        return _mapped[path][1]
+
+    forget(path)
+    while len(_mapped) >= MAX_MAPPED:
+        forget(next(iter(_mapped)))
+    data: mmap.mmap | bytes
+    with open(path, "rb") as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else b""
+    with memoryview(data) as whole:
+        end = len(whole)
+        while end and whole[end - 1] in WHITESPACE:
+            end -= 1
+        _mapped[path] = (mtime, whole[:end])
+    return _mapped[path][1]
+
+
+def read_file(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read().rstrip()
+
+
+def read_input_bytes(day: str) -> memoryview:
+    return map_file(input_path(day))
+
+
+def read_input(day: str) -> str:
+    path = os.path.realpath(input_path(day))
+    mtime = os.stat(path).st_mtime_ns
+    if path not in _inputs or _inputs[path][0] != mtime:
+        _inputs[path] = (mtime, read_file(path))
+    return _inputs[path][1]
+
+
+def file_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
 
 
 def input_to_ints(input: str) -> list[int]:
@@ -63,6 +120,52 @@ def test_read_input():
     assert read_input("day_00.py") == "123\n456\n012"
 
 
+def test_read_input_cached():
+    assert read_input("day_00.py") is read_input("day_00.py")
+
+
+def test_read_file(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("abc\ndef\n\n")
+    assert read_file(str(path)) == "abc\ndef"
+    assert map_file(str(path)) == b"abc\ndef"
+    assert map_file(str(path)) is map_file(str(path))
+
+
+def test_map_file_reloads_on_change(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("old")
+    old = map_file(str(path))
+    assert old == b"old"
+    path.write_text("newer")
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    assert map_file(str(path)) == b"newer"
+    assert len(bytes(old)) == 3
+
+
+def test_read_file_empty(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("")
+    assert read_file(str(path)) == ""
+    assert len(map_file(str(path))) == 0
+
+
+def test_map_file_bounded(tmp_path):
+    paths = [tmp_path / f"{i}.txt" for i in range(MAX_MAPPED + 5)]
+    first = None
+    for path in paths:
+        path.write_text(path.stem)
+        first = first or map_file(str(path))
+    assert len(_mapped) <= MAX_MAPPED
+    assert first == b"0"
+
+    view = map_file(str(paths[-1]))
+    forget(str(paths[-1]))
+    assert os.path.realpath(paths[-1]) not in _mapped
+    assert map_file(str(paths[-1])) is not view
+    assert view == paths[-1].stem.encode()
+
+
 def test_input_to_ints():
     test_input = read_input("day_00.py")
     assert input_to_ints(test_input) == [123, 456, 12]
@@ -0,0 +1,176 @@
+# Standard Library
+import json
+import math
+import subprocess
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Self
+
+# First Party
+from utils.helpers import file_hash, input_path
+from utils.stats import Timing
+
+
+@dataclass(frozen=True)
+class HistoryRecord:
+    day: str
+    part: int
+    commit: str
+    input_hash: str
+    timestamp: str
+    min: float
+    median: float
+    p95: float
+    stddev: float
+    iterations: int
+    error: str | None = None
+    instructions: int | None = None
+    # How the run was measured, older history without these fields was taken with the defaults
+    gc: str = "on"
+    caches: str = "cold"
+    warmup: int = 1
+    limited: bool = False
+    # Days with a separate parse step are timed on the parsed input, older history timed the whole part
+    split_parse: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def mode(self) -> tuple[str, str, int, bool, bool]:
+        return self.gc, self.caches, self.warmup, self.limited, self.split_parse
+
+    @classmethod
+    def from_timing(  # noqa: PLR0913
+        cls,
+        day: str,
+        part: int,
+        commit: str,
+        timestamp: str,
+        timing: Timing,
+        instructions: int | None = None,
+        **mode: Any,
+    ) -> Self:
+        return cls(
+            day,
+            part,
+            commit,
+            input_hash(day),
+            timestamp,
+            timing.min,
+            timing.median,
+            timing.p95,
+            timing.stddev,
+            timing.iterations,
+            timing.error,
+            instructions,
+            **{"split_parse": not math.isnan(timing.parse), **mode},
+        )
+
+
+def git_commit() -> str:
+    try:
+        result = subprocess.run(
+            ["git", "describe", "--always", "--dirty", "--abbrev=12"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return "unknown"
+    return result.stdout.strip()
+
+
+def input_hash(day: str) -> str:
+    try:
+        return file_hash(input_path(day))
+    except FileNotFoundError:
+        return "missing"
+
+
+def now() -> str:
+    return datetime.now(UTC).isoformat()
+
+
+def load_history(path: Path) -> list[HistoryRecord]:
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return [HistoryRecord(**json.loads(line)) for line in f if line.strip()]
+
+
+def append_history(path: Path, records: list[HistoryRecord]) -> None:
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(asdict(record)) + "\n")
+
+
+def find_baseline(history: list[HistoryRecord], record: HistoryRecord, counted: bool = False) -> HistoryRecord | None:
+    for previous in reversed(history):
+        if (
+            previous.ok
+            and (not counted or previous.instructions is not None)
+            and previous.timestamp < record.timestamp
+            and previous.mode == record.mode
+            and (previous.day, previous.part, previous.input_hash) == (record.day, record.part, record.input_hash)
+        ):
+            return previous
+    return None
+
+
+def change(baseline: HistoryRecord, record: HistoryRecord) -> float:
+    return (record.median - baseline.median) / baseline.median
+
+
+# --- tests
+
+
+def make_record(timestamp: str, median: float, input_hash: str = "abc", error: str | None = None) -> HistoryRecord:
+    return HistoryRecord("day_01", 1, "deadbeef", input_hash, timestamp, median, median, median, 0.0, 10, error)
+
+
+def test_history_round_trip(tmp_path: Path):
+    path = tmp_path / "history.jsonl"
+    records = [make_record("2023-12-01", 1.0), make_record("2023-12-02", 2.0)]
+    append_history(path, records[:1])
+    append_history(path, records[1:])
+    assert load_history(path) == records
+
+
+def test_load_history_missing(tmp_path: Path):
+    assert load_history(tmp_path / "missing.jsonl") == []
+
+
+def test_find_baseline():
+    history = [
+        make_record("2023-12-01", 1.0),
+        make_record("2023-12-02", 2.0, input_hash="other"),
+        make_record("2023-12-03", 3.0, error="ValueError"),
+        make_record("2023-12-04", 4.0),
+    ]
+    record = make_record("2023-12-04", 5.0)
+    assert find_baseline(history, record) == history[0]
+    assert find_baseline(history, make_record("2023-12-01", 1.0)) is None
+
+
+def test_find_baseline_same_mode():
+    frozen = replace(make_record("2023-12-02", 2.0), gc="freeze")
+    history = [make_record("2023-12-01", 1.0), frozen]
+    assert find_baseline(history, make_record("2023-12-03", 3.0)) == history[0]
+    assert find_baseline(history, replace(make_record("2023-12-03", 3.0), gc="freeze")) == frozen
+    assert find_baseline(history, replace(make_record("2023-12-03", 3.0), warmup=5)) is None
+    assert find_baseline(history, replace(make_record("2023-12-03", 3.0), split_parse=True)) is None
+
+
+def test_find_counted_baseline():
+    counted = HistoryRecord("day_01", 1, "cafe", "abc", "2023-12-01", 1.0, 1.0, 1.0, 0.0, 10, None, 1_000)
+    history = [counted, make_record("2023-12-02", 2.0)]
+    record = make_record("2023-12-03", 3.0)
+    assert find_baseline(history, record) == history[1]
+    assert find_baseline(history, record, counted=True) == counted
+
+
+def test_change():
+    assert change(make_record("2023-12-01", 1.0), make_record("2023-12-02", 1.5)) == 0.5
@@ -0,0 +1,283 @@
+# Standard Library
+import contextlib
+import json
+import os
+import sys
+from collections import defaultdict
+from collections.abc import Generator
+from contextlib import contextmanager
+from cProfile import Profile
+from dataclasses import dataclass
+from functools import cache
+from pstats import Stats
+from time import perf_counter_ns
+from types import CodeType
+from typing import Any
+
+# First Party
+from utils.counting import free_tool
+
+Func = tuple[str, int, str]
+Stack = tuple[Func, ...]
+
+
+def frame_name(func: Func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"
+
+
+def _call_graph(stats: Stats) -> tuple[dict[Func, list[Func]], list[Func]]:
+    children: dict[Func, list[Func]] = defaultdict(list)
+    roots: list[Func] = []
+    for func, (*_, callers) in stats.stats.items():  # type: ignore[attr-defined]
+        known = [caller for caller in callers if caller in stats.stats]  # type: ignore[attr-defined]
+        for caller in known:
+            children[caller].append(func)
+        if not known:
+            roots.append(func)
+    return children, roots
+
+
+def stacks(stats: Stats, min_weight: float = 1e-7) -> Generator[tuple[Stack, float], None, None]:
+    # cProfile only keeps caller -> callee edges, so a function's time is shared
+    # between its callers in proportion to the time spent under each of them
+    entries = stats.stats  # type: ignore[attr-defined]
+    children, roots = _call_graph(stats)
+
+    def walk(stack: Stack, share: float) -> Generator[tuple[Stack, float], None, None]:
+        func = stack[-1]
+        _, _, own, _, _ = entries[func]
+        if own * share >= min_weight:
+            yield stack, own * share
+        for child in children[func]:
+            if child in stack:
+                continue
+            _, _, _, child_total, callers = entries[child]
+            via = callers[func][3]
+            if child_total <= 0 or via * share < min_weight:
+                continue
+            yield from walk((*stack, child), share * via / child_total)
+
+    for root in roots:
+        yield from walk((root,), 1.0)
+
+
+def to_collapsed(stats: Stats) -> str:
+    lines: dict[str, float] = defaultdict(float)
+    for stack, weight in stacks(stats):
+        lines[";".join(frame_name(func) for func in stack)] += weight
+    return "\n".join(f"{stack} {round(weight * 1_000_000)}" for stack, weight in lines.items() if weight >= 5e-7)
+
+
+def to_speedscope(stats: Stats, name: str) -> dict[str, Any]:
+    frames: dict[Func, int] = {}
+    samples: list[list[int]] = []
+    weights: list[float] = []
+    for stack, weight in stacks(stats):
+        samples.append([frames.setdefault(func, len(frames)) for func in stack])
+        weights.append(weight)
+
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "advent-of-code",
+        "activeProfileIndex": 0,
+        "shared": {
+            "frames": [
+                {"name": func[2], "file": func[0], "line": func[1]} if func[0] != "~" else {"name": func[2]} for func in frames
+            ],
+        },
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            },
+        ],
+    }
+
+
+def summary(stats: Stats) -> dict[str, Any]:
+    entries: dict[Func, tuple[int, int, float, float, Any]] = stats.stats  # type: ignore[attr-defined]
+    hottest = max(entries, key=lambda func: entries[func][2], default=None)
+    return {
+        "calls": stats.total_calls,  # type: ignore[attr-defined]
+        "primitive_calls": stats.prim_calls,  # type: ignore[attr-defined]
+        "total_time": stats.total_tt,  # type: ignore[attr-defined]
+        "hottest": frame_name(hottest) if hottest is not None else None,
+    }
+
+
+@dataclass
+class LineStat:
+    hits: int = 0
+    time: int = 0
+
+
+@cache
+def _line_at(code: CodeType, offset: int) -> int:
+    return next((line or 0 for start, end, line in code.co_lines() if start <= offset < end), 0)
+
+
+@contextmanager
+def line_profile(filename: str) -> Generator[dict[int, LineStat], None, None]:
+    # Each running frame from the file keeps its current line and when that line was last
+    # charged. Only the innermost frame is charged, so nested frames are not counted twice
+    monitoring = sys.monitoring
+    events = monitoring.events
+    lines: dict[int, LineStat] = defaultdict(LineStat)
+    frames: list[list[int]] = []
+
+    def charge(now: int) -> None:
+        if frames:
+            frame = frames[-1]
+            if frame[0]:
+                lines[frame[0]].time += now - frame[1]
+            frame[1] = now
+
+    def pop() -> None:
+        if frames:
+            now = perf_counter_ns()
+            charge(now)
+            frames.pop()
+            if frames:
+                frames[-1][1] = now
+
+    def enter(code: CodeType, offset: int) -> Any:
+        if code.co_filename != filename:
+            return monitoring.DISABLE
+        now = perf_counter_ns()
+        charge(now)
+        frames.append([_line_at(code, offset) if offset else 0, now])
+        return None
+
+    def leave(code: CodeType, *_: Any) -> Any:
+        if code.co_filename != filename:
+            return monitoring.DISABLE
+        pop()
+        return None
+
+    def unwind(code: CodeType, *_: Any) -> None:
+        if code.co_filename == filename:
+            pop()
+
+    def line(code: CodeType, number: int) -> Any:
+        if code.co_filename != filename:
+            return monitoring.DISABLE
+        if frames:
+            charge(perf_counter_ns())
+            frames[-1][0] = number
+        lines[number].hits += 1
+        return None
+
+    callbacks = {
+        events.PY_START: enter,
+        events.PY_RESUME: enter,
+        events.PY_RETURN: leave,
+        events.PY_YIELD: leave,
+        events.PY_UNWIND: unwind,
+        events.LINE: line,
+    }
+    tool = free_tool()
+    monitoring.use_tool_id(tool, "aoc-lines")
+    for event, callback in callbacks.items():
+        monitoring.register_callback(tool, event, callback)
+    try:
+        monitoring.set_events(tool, sum(callbacks))
+        yield lines
+    finally:
+        monitoring.set_events(tool, events.NO_EVENTS)
+        for event in callbacks:
+            monitoring.register_callback(tool, event, None)
+        monitoring.free_tool_id(tool)
+        monitoring.restart_events()
+
+
+def hottest_lines(lines: dict[int, LineStat], limit: int) -> list[tuple[int, LineStat]]:
+    return sorted(lines.items(), key=lambda item: item[1].time, reverse=True)[:limit]
+
+
+def export(stats: Stats, path: str, format: str, name: str) -> None:
+    match format:
+        case "pstats":
+            stats.dump_stats(path)
+        case "collapsed":
+            with open(path, "w") as f:
+                f.write(to_collapsed(stats) + "\n")
+        case "speedscope":
+            with open(path, "w") as f:
+                json.dump(to_speedscope(stats, name), f)
+        case _:
+            raise ValueError(f"Unknown profile format: {format}")
+
+
+# --- tests
+
+
+def _leaf(n: int) -> int:
+    return sum(i * i for i in range(n))
+
+
+def _branch() -> int:
+    return _leaf(20_000) + _leaf(10_000)
+
+
+def _profile() -> Stats:
+    with Profile() as profile:
+        _branch()
+    return Stats(profile)
+
+
+def test_stacks_follow_calls():
+    found = {tuple(func[2] for func in stack) for stack, _ in stacks(_profile())}
+    assert any(stack[-2:] == ("_branch", "_leaf") for stack in found)
+
+
+def test_stack_weights_match_total():
+    stats = _profile()
+    total = sum(weight for _, weight in stacks(stats, 0))
+    assert abs(total - stats.total_tt) < stats.total_tt * 0.01  # type: ignore[attr-defined]
+
+
+def test_summary():
+    found = summary(_profile())
+    assert found["calls"] >= found["primitive_calls"] > 0
+    assert found["total_time"] > 0
+    # The generator and the builtin sum consuming it take almost the same time, either can come out on top
+    assert found["hottest"].startswith(("<genexpr>", "_leaf", "<built-in method builtins.sum>"))
+
+
+def test_line_profile():
+    with line_profile(__file__) as lines:
+        _branch()
+    leaf = _leaf.__code__.co_firstlineno + 1
+    branch = _branch.__code__.co_firstlineno + 1
+    assert lines[branch].hits == 1
+    assert lines[leaf].time > lines[branch].time > 0
+    assert hottest_lines(lines, 1)[0][0] == leaf
+
+
+def test_line_profile_unwinds():
+    with line_profile(__file__) as lines, contextlib.suppress(TypeError):
+        _leaf("ten")  # type: ignore[arg-type]
+    assert lines[_leaf.__code__.co_firstlineno + 1].hits == 1
+
+
+def test_to_collapsed():
+    lines = to_collapsed(_profile()).splitlines()
+    assert any(";_leaf (profiling.py:" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_to_speedscope():
+    profile = to_speedscope(_profile(), "test")
+    frames = profile["shared"]["frames"]
+    sampled = profile["profiles"][0]
+    assert len(sampled["samples"]) == len(sampled["weights"])
+    assert all(0 <= index < len(frames) for sample in sampled["samples"] for index in sample)
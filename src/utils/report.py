@@ -0,0 +1,99 @@
+# Standard Library
+import csv
+import io
+import json
+import math
+import platform
+import sys
+from typing import Any, Self, TextIO
+
+Record = dict[str, Any]
+
+
+def python_version() -> str:
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+
+def status(error: str | None) -> str:
+    if error is None:
+        return "ok"
+    return error if error in ("timeout", "oom") else "error"
+
+
+def _clean(value: Any) -> Any:
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if isinstance(value, bool | int | float | str) or value is None:
+        return value
+    return str(value)
+
+
+class Report:
+    def __init__(self, format: str, stream: TextIO | None = None) -> None:
+        self.format = format
+        self.stream = stream or sys.stdout
+        self.records: list[Record] = []
+        self.writer: csv.DictWriter[str] | None = None
+
+    def write(self, record: Record) -> None:
+        record = {key: _clean(value) for key, value in record.items()}
+        if self.format == "jsonl":
+            self.stream.write(json.dumps(record) + "\n")
+        elif self.format == "csv":
+            if self.writer is None:
+                self.writer = csv.DictWriter(self.stream, fieldnames=list(record))
+                self.writer.writeheader()
+            self.writer.writerow(record)
+        else:
+            self.records.append(record)
+        self.stream.flush()
+
+    def close(self) -> None:
+        if self.format == "json":
+            self.records.sort(key=lambda record: (record.get("day", ""), record.get("part", 0)))
+            self.stream.write(json.dumps(self.records, indent=2) + "\n")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+# --- tests
+
+
+def test_status():
+    assert status(None) == "ok"
+    assert status("timeout") == "timeout"
+    assert status("ValueError") == "error"
+
+
+def test_python_version():
+    assert python_version().endswith(platform.python_version())
+
+
+def test_report_jsonl():
+    stream = io.StringIO()
+    with Report("jsonl", stream) as report:
+        report.write({"day": "day_02", "part": 1, "median": math.nan})
+        assert stream.getvalue() == '{"day": "day_02", "part": 1, "median": null}\n'
+        report.write({"day": "day_01", "part": 1, "median": 0.5})
+    assert len(stream.getvalue().splitlines()) == 2
+
+
+def test_report_json_sorted():
+    stream = io.StringIO()
+    with Report("json", stream) as report:
+        report.write({"day": "day_02", "part": 1})
+        report.write({"day": "day_01", "part": 2})
+        assert stream.getvalue() == ""
+    assert json.loads(stream.getvalue()) == [{"day": "day_01", "part": 2}, {"day": "day_02", "part": 1}]
+
+
+def test_report_csv():
+    stream = io.StringIO()
+    with Report("csv", stream) as report:
+        report.write({"day": "day_01", "part": 1, "error": None})
+        report.write({"day": "day_01", "part": 2, "error": "timeout"})
+    assert stream.getvalue().splitlines() == ["day,part,error", "day_01,1,", "day_01,2,timeout"]
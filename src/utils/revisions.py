@@ -0,0 +1,220 @@
+# Standard Library
+import subprocess
+import sys
+import tempfile
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Self
+
+# Runs a single part from whichever tree is first on sys.path, using only part_N so older
+# revisions without the newer harness hooks can still be measured. Timings go over a copy of
+# stdout while the solver's own output is discarded, and the day's caches are cleared before
+# each run unless the parent asks for a warm one
+RUNNER = """
+import os, sys, time
+from importlib import import_module
+src, day, part, path = sys.argv[1:]
+sys.path.insert(0, src)
+report = os.fdopen(os.dup(1), "w")
+devnull = os.open(os.devnull, os.O_WRONLY)
+os.dup2(devnull, 1)
+try:
+    module = import_module(day)
+    solver = getattr(module, f"part_{part}")
+except Exception as e:
+    print(f"!{type(e).__name__}", file=report, flush=True)
+    raise SystemExit
+caches = []
+for value in vars(module).values():
+    if hasattr(value, "cache_factory") and callable(getattr(value, "clear", None)):
+        caches.append(value.clear)
+    if getattr(value, "__module__", None) == module.__name__:
+        members = [value, *vars(value).values()] if isinstance(value, type) else [value]
+        caches.extend(m.cache_clear for m in members if callable(getattr(m, "cache_clear", None)))
+with open(path) as f:
+    input_str = f.read().rstrip()
+print("ready", file=report, flush=True)
+for line in sys.stdin:
+    if line.strip() != "warm":
+        for cache_clear in caches:
+            cache_clear()
+    start = time.perf_counter_ns()
+    try:
+        solver(input_str)
+    except Exception as e:
+        print(f"!{type(e).__name__}", file=report, flush=True)
+        continue
+    sys.stdout.flush()
+    print(time.perf_counter_ns() - start, file=report, flush=True)
+"""
+
+
+class RevisionError(Exception):
+    pass
+
+
+def resolve(rev: str, cwd: Path | None = None) -> str:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "--short=12", f"{rev}^{{commit}}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=cwd,
+        )
+    except (FileNotFoundError, subprocess.CalledProcessError) as e:
+        raise RevisionError(f"Unknown revision {rev!r}") from e
+    return result.stdout.strip()
+
+
+@contextmanager
+def worktree(rev: str, cwd: Path | None = None) -> Generator[Path, None, None]:
+    commit = resolve(rev, cwd)
+    with tempfile.TemporaryDirectory(prefix="aoc-worktree-") as tmp:
+        path = Path(tmp) / commit
+        subprocess.run(["git", "worktree", "add", "--detach", str(path), commit], capture_output=True, check=True, cwd=cwd)
+        try:
+            yield path
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", str(path)], capture_output=True, check=False, cwd=cwd)
+
+
+class Runner:
+    def __init__(self, src: Path, day: str, part: int, input_path: str) -> None:
+        self.error: str | None = None
+        self.process = subprocess.Popen(
+            [sys.executable, "-c", RUNNER, str(src), day, str(part), input_path],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            cwd=src.parent,
+        )
+        self._check(self._read())
+
+    def _read(self) -> str:
+        assert self.process.stdout is not None
+        return self.process.stdout.readline().strip() or "!exited"
+
+    def _check(self, line: str) -> None:
+        if line.startswith("!"):
+            self.error = line[1:]
+
+    def run(self, warm: bool = False) -> int | None:
+        if self.error is not None:
+            return None
+        assert self.process.stdin is not None
+        self.process.stdin.write("warm\n" if warm else "\n")
+        self.process.stdin.flush()
+        line = self._read()
+        self._check(line)
+        if self.error is not None:
+            return None
+        try:
+            return int(line)
+        except ValueError:
+            self.error = f"unexpected output {line[:40]!r}"
+            return None
+
+    def close(self) -> None:
+        if self.process.stdin is not None:
+            self.process.stdin.close()
+        self.process.wait()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+
+def alternate(ours: Runner, theirs: Runner, iterations: int, warmup: int = 0) -> tuple[list[int], list[int]]:
+    for _ in range(warmup):
+        ours.run()
+        theirs.run()
+
+    times: tuple[list[int], list[int]] = ([], [])
+    for i in range(iterations):
+        order = [(0, ours), (1, theirs)] if i % 2 == 0 else [(1, theirs), (0, ours)]
+        for side, runner in order:
+            if (elapsed := runner.run()) is None:
+                return times
+            times[side].append(elapsed)
+    return times
+
+
+# --- tests
+
+
+def _module(tmp_path: Path, body: str) -> tuple[Path, str]:
+    src = tmp_path / "src"
+    src.mkdir(exist_ok=True)
+    (src / "day_42.py").write_text(body)
+    (tmp_path / "input.txt").write_text("12345\n")
+    return src, str(tmp_path / "input.txt")
+
+
+def test_runner(tmp_path: Path):
+    body = "def part_1(input):\n    assert input == '12345', input\n\ndef part_2(input):\n    raise ValueError\n"
+    src, path = _module(tmp_path, body)
+    with Runner(src, "day_42", 1, path) as ours, Runner(src, "day_42", 1, path) as theirs:
+        first, second = alternate(ours, theirs, 3, warmup=1)
+    assert len(first) == len(second) == 3
+    assert all(elapsed > 0 for elapsed in first + second)
+
+    with Runner(src, "day_42", 2, path) as failing:
+        assert failing.run() is None
+        assert failing.error == "ValueError"
+    with Runner(src, "day_43", 1, path) as missing:
+        assert missing.error == "ModuleNotFoundError"
+
+
+def test_runner_ignores_solver_output(tmp_path: Path):
+    src, path = _module(tmp_path, "import os\n\ndef part_1(input):\n    print(input)\n    os.write(1, b'7\\n')\n")
+    with Runner(src, "day_42", 1, path) as runner:
+        assert all(runner.run() for _ in range(3))
+        assert runner.error is None
+
+
+def test_runner_clears_caches(tmp_path: Path):
+    body = (
+        "from functools import cache\n\nseen = []\n\n@cache\ndef work(n):\n    seen.append(n)\n\n"
+        "def part_1(input):\n    before = len(seen)\n    work(1)\n    if len(seen) == before:\n        raise LookupError\n"
+    )
+    src, path = _module(tmp_path, body)
+    with Runner(src, "day_42", 1, path) as runner:
+        assert runner.run()
+        assert runner.run()
+        assert runner.run(warm=True) is None
+        assert runner.error == "LookupError"
+
+
+def test_runner_fresh_process(tmp_path: Path):
+    # the cold-then-warm pair time_it_fresh takes from each new process, with a solver that prints
+    body = (
+        "import os\nfrom functools import cache\n\nseen = []\n\n@cache\ndef work(n):\n    seen.append(n)\n\n"
+        "def part_1(input):\n    print(input)\n    os.write(1, b'7\\n')\n    work(1)\n"
+        "    if len(seen) > 1:\n        raise LookupError\n"
+    )
+    src, path = _module(tmp_path, body)
+    with Runner(src, "day_42", 1, path) as runner:
+        cold = runner.run()
+        warm = runner.run(warm=True)
+    assert cold
+    assert warm
+    assert runner.error is None
+
+
+def test_worktree():
+    head = resolve("HEAD")
+    with worktree("HEAD") as path:
+        assert (path / "src").is_dir()
+        assert resolve("HEAD", path) == head
+    assert not path.exists()
+
+
+def test_resolve_unknown():
+    import pytest
+
+    with pytest.raises(RevisionError, match="no-such-revision-here"):
+        resolve("no-such-revision-here")
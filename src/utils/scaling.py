@@ -0,0 +1,86 @@
+# Standard Library
+import math
+from dataclasses import dataclass, field
+from types import ModuleType
+
+
+@dataclass(frozen=True)
+class Scaling:
+    base: int
+    part_1: float
+    part_2: float
+
+    def expected(self, part: int) -> float:
+        return self.part_1 if part == 1 else self.part_2
+
+
+@dataclass
+class Curve:
+    sizes: list[int] = field(default_factory=list)
+    times: list[float] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def exponent(self) -> float:
+        return fit_exponent(self.sizes, self.times)
+
+
+def scalable(module: ModuleType) -> bool:
+    return callable(getattr(module, "generate", None)) and isinstance(getattr(module, "SCALING", None), Scaling)
+
+
+def sizes(base: int, steps: int, factor: float) -> list[int]:
+    return [max(round(base * factor**step), 1) for step in range(steps)]
+
+
+def fit_exponent(sizes: list[int], times: list[float]) -> float:
+    from statistics import StatisticsError, linear_regression
+
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if s > 0 and t > 0]
+    if len(points) < 2:
+        return math.nan
+    try:
+        slope, _ = linear_regression(*zip(*points))
+    except StatisticsError:
+        return math.nan
+    return slope
+
+
+# --- tests
+
+
+def test_sizes():
+    assert sizes(10, 4, 2) == [10, 20, 40, 80]
+    assert sizes(1, 3, 0.5) == [1, 1, 1]
+
+
+def test_fit_exponent():
+    ns = [10, 20, 40, 80]
+    assert math.isclose(fit_exponent(ns, [n * 1e-6 for n in ns]), 1)
+    assert math.isclose(fit_exponent(ns, [n**2 * 1e-6 for n in ns]), 2)
+    assert math.isclose(fit_exponent(ns, [3.0] * 4), 0, abs_tol=1e-9)
+
+
+def test_fit_exponent_degenerate():
+    assert math.isnan(fit_exponent([10], [1.0]))
+    assert math.isnan(fit_exponent([10, 10], [1.0, 2.0]))
+    assert math.isnan(fit_exponent([10, 20], [0.0, 0.0]))
+
+
+def test_curve():
+    curve = Curve([10, 100], [1.0, 10.0])
+    assert curve.ok
+    assert math.isclose(curve.exponent, 1)
+
+
+def test_scalable():
+    module = ModuleType("day_test")
+    assert not scalable(module)
+    module.generate = lambda size, seed=0: "x" * size  # type: ignore[attr-defined]
+    module.SCALING = Scaling(10, 1, 1)  # type: ignore[attr-defined]
+    assert scalable(module)
+    assert module.SCALING.expected(2) == 1  # type: ignore[attr-defined]
@@ -0,0 +1,199 @@
+# Standard Library
+import asyncio
+import json
+import multiprocessing
+from importlib import import_module
+from multiprocessing.connection import Connection
+from time import perf_counter
+from typing import Any
+
+# First Party
+from utils.batch import solve_input
+from utils.execution import Outcome
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+
+def _work(conn: Connection, days: list[str]) -> None:
+    for day in days:
+        import_module(day)
+    while True:
+        try:
+            day, part, input_str = conn.recv()
+        except EOFError:
+            return
+        conn.send(solve_input(day, input_str, (part,))[part])
+
+
+class Worker:
+    def __init__(self, days: list[str]) -> None:
+        context = multiprocessing.get_context("spawn")
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_work, args=(child, days), daemon=True)
+        self.process.start()
+        child.close()
+
+    def solve(self, day: str, part: int, input_str: str) -> Outcome:
+        self.conn.send((day, part, input_str))
+        return self.conn.recv()
+
+    def kill(self) -> None:
+        self.process.kill()
+        self.process.join()
+
+
+class SolverService:
+    def __init__(self, days: list[str], workers: int = 1, timeout: float = 30) -> None:
+        self.days = days
+        self.timeout = timeout
+        self.workers = [Worker(days) for _ in range(max(workers, 1))]
+        self.idle: asyncio.Queue[Worker] = asyncio.Queue()
+        for worker in self.workers:
+            self.idle.put_nowait(worker)
+
+    def _replace(self, worker: Worker) -> Worker:
+        worker.kill()
+        replacement = Worker(self.days)
+        self.workers[self.workers.index(worker)] = replacement
+        return replacement
+
+    async def solve(self, day: str, part: int, input_str: str, wall: float | None = None) -> dict[str, Any]:
+        if day not in self.days:
+            raise ValueError(f"Unknown day {day!r}")
+        if part not in (1, 2):
+            raise ValueError(f"Unknown part {part!r}")
+        limit = wall or self.timeout
+
+        start = perf_counter()
+        worker = await self.idle.get()
+        queued = perf_counter() - start
+
+        healthy = False
+        try:
+            loop = asyncio.get_running_loop()
+            outcome = await asyncio.wait_for(loop.run_in_executor(None, worker.solve, day, part, input_str), limit)
+            healthy = True
+        except TimeoutError:
+            outcome = Outcome("timeout", error=f"Exceeded {limit}s wall clock")
+        except EOFError:
+            outcome = Outcome("error", error="Worker exited")
+        finally:
+            if not healthy:
+                worker = self._replace(worker)
+            self.idle.put_nowait(worker)
+
+        return {
+            "day": day,
+            "part": part,
+            "status": outcome.status,
+            "answer": outcome.value,
+            "error": outcome.error,
+            "timing": {"queued": queued, "solve": outcome.wall, "total": perf_counter() - start},
+        }
+
+    async def _respond(self, reader: asyncio.StreamReader) -> tuple[int, dict[str, Any]]:
+        method, path, _ = (await reader.readline()).decode().split(" ", 2)
+        headers: dict[str, str] = {}
+        while line := (await reader.readline()).decode().strip():
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if (method, path) == ("GET", "/health"):
+            return 200, {"status": "ok", "workers": len(self.workers), "days": self.days}
+        if (method, path) != ("POST", "/solve"):
+            return 404, {"error": f"No route for {method} {path}"}
+
+        body = json.loads(await reader.readexactly(int(headers.get("content-length", 0))))
+        return 200, await self.solve(body["day"], int(body["part"]), body["input"], body.get("timeout"))
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            status, body = await self._respond(reader)
+        except (ValueError, KeyError, TypeError, asyncio.IncompleteReadError) as e:
+            status, body = 400, {"error": f"{type(e).__name__}: {e}"}
+
+        payload = json.dumps(body, default=str).encode()
+        head = f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: application/json\r\n"
+        head += f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n"
+        writer.write(head.encode() + payload)
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    def close(self) -> None:
+        for worker in self.workers:
+            worker.kill()
+
+
+async def serve(service: SolverService, host: str = "127.0.0.1", port: int = 8023, socket: str | None = None) -> None:
+    if socket is not None:
+        server = await asyncio.start_unix_server(service.handle, socket)
+    else:
+        server = await asyncio.start_server(service.handle, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+async def call(
+    method: str,
+    path: str,
+    payload: dict[str, Any] | None = None,
+    host: str = "127.0.0.1",
+    port: int = 8023,
+) -> tuple[int, dict[str, Any]]:
+    reader, writer = await asyncio.open_connection(host, port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return status, json.loads(response.split(b"\r\n\r\n", 1)[1])
+
+
+# --- tests
+
+
+async def _exchange(requests: list[tuple[str, str, dict[str, Any] | None]]) -> list[tuple[int, dict[str, Any]]]:
+    service = SolverService(["day_15"], timeout=10)
+    server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with server:
+            return [await call(method, path, payload, port=port) for method, path, payload in requests]
+    finally:
+        service.close()
+
+
+def test_service():
+    example = "rn=1,cm-,qp=3,cm=2,qp-,pc=4,ot=9,ab=5,pc-,pc=6,ot=7"
+    responses = asyncio.run(
+        _exchange(
+            [
+                ("GET", "/health", None),
+                ("POST", "/solve", {"day": "day_15", "part": 1, "input": example}),
+                ("POST", "/solve", {"day": "day_15", "part": 2, "input": example, "timeout": 1e-6}),
+                ("POST", "/solve", {"day": "day_15", "part": 2, "input": example}),
+                ("POST", "/solve", {"day": "day_99", "part": 1, "input": example}),
+                ("POST", "/solve", {"day": "day_15"}),
+                ("GET", "/missing", None),
+            ],
+        ),
+    )
+    health, solved, timed_out, recovered, unknown, incomplete, missing = responses
+
+    assert health == (200, {"status": "ok", "workers": 1, "days": ["day_15"]})
+
+    assert solved[0] == 200
+    assert solved[1]["answer"] == 1320
+    assert solved[1]["status"] == "ok"
+    assert solved[1]["timing"]["solve"] <= solved[1]["timing"]["total"]
+
+    assert timed_out[1]["status"] == "timeout"
+    assert recovered[1]["answer"] == 145
+
+    assert unknown == (400, {"error": "ValueError: Unknown day 'day_99'"})
+    assert incomplete[0] == 400
+    assert missing[0] == 404
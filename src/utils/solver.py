@@ -0,0 +1,139 @@
+# Standard Library
+import math
+from collections.abc import Callable
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any
+
+# First Party
+from utils.collections import BoundedCachingDict, CachingDict, LRUCachingDict
+from utils.stats import NS_PER_SECOND
+
+MAX_PARSED = 4
+
+_parsed: dict[tuple[str, str], tuple[Any, float]] = {}
+
+
+def uses_parse(module: ModuleType) -> bool:
+    return all(callable(getattr(module, name, None)) for name in ["parse", "solve_1", "solve_2"])
+
+
+def parsed_input(module: ModuleType, input_str: str) -> tuple[Any, float]:
+    key = (module.__name__, input_str)
+    if key not in _parsed:
+        # Scaled runs parse many large generated inputs, only the latest few are worth keeping
+        while len(_parsed) >= MAX_PARSED:
+            del _parsed[next(iter(_parsed))]
+        start = perf_counter_ns()
+        parsed = module.parse(input_str)
+        _parsed[key] = parsed, (perf_counter_ns() - start) / NS_PER_SECOND
+    return _parsed[key]
+
+
+def release(module: ModuleType, input_str: str) -> None:
+    _parsed.pop((module.__name__, input_str), None)
+
+
+def module_caches(module: ModuleType) -> list[Callable[[], None]]:
+    found: list[Callable[[], None]] = []
+    for value in vars(module).values():
+        if isinstance(value, CachingDict | BoundedCachingDict):
+            found.append(value.clear)
+        if getattr(value, "__module__", None) != module.__name__:
+            continue
+        candidates = [value, *vars(value).values()] if isinstance(value, type) else [value]
+        found.extend(candidate.cache_clear for candidate in candidates if callable(getattr(candidate, "cache_clear", None)))
+    return found
+
+
+def clear_caches(caches: list[Callable[[], None]]) -> None:
+    for cache_clear in caches:
+        cache_clear()
+
+
+def prepare(module: ModuleType, part: int, input_str: str) -> tuple[Callable[[], Any], float]:
+    if not uses_parse(module):
+        solver = getattr(module, f"part_{part}")
+        return lambda: solver(input_str), math.nan
+
+    parsed, parse_time = parsed_input(module, input_str)
+    solver = getattr(module, f"solve_{part}")
+    return lambda: solver(parsed), parse_time
+
+
+# --- tests
+
+
+def _module(calls: list[str]) -> ModuleType:
+    def parse(input: str) -> list[str]:
+        calls.append("parse")
+        return input.split(",")
+
+    module = ModuleType("day_test")
+    module.parse = parse  # type: ignore[attr-defined]
+    module.solve_1 = len  # type: ignore[attr-defined]
+    module.solve_2 = lambda parsed: sum(map(int, parsed))  # type: ignore[attr-defined]
+    return module
+
+
+def test_prepare_parses_once():
+    calls: list[str] = []
+    module = _module(calls)
+    run_1, parse_time = prepare(module, 1, "1,2,3")
+    run_2, _ = prepare(module, 2, "1,2,3")
+    assert (run_1(), run_2()) == (3, 6)
+    assert calls == ["parse"]
+    assert parse_time >= 0
+
+
+def test_release():
+    calls: list[str] = []
+    module = _module(calls)
+    prepare(module, 1, "1,2")
+    release(module, "1,2")
+    release(module, "1,2")
+    prepare(module, 2, "1,2")
+    assert calls == ["parse", "parse"]
+
+
+def test_parsed_input_bounded():
+    calls: list[str] = []
+    module = _module(calls)
+    for size in range(MAX_PARSED + 3):
+        prepare(module, 1, ",".join("1" * (size + 1)))
+    assert len(_parsed) <= MAX_PARSED
+    prepare(module, 1, "1")
+    assert len(calls) == MAX_PARSED + 4
+
+
+def test_module_caches():
+    import day_07
+
+    module = ModuleType("day_test")
+    exec(
+        "from functools import cache, lru_cache\n"
+        "@cache\ndef find(n): return n\n"
+        "class Hand:\n    @lru_cache\n    def score(self): return 1\n",
+        vars(module),
+    )
+    module.lookup = CachingDict[int, int](lambda key: key)  # type: ignore[attr-defined]
+    module.lookup[1]  # type: ignore[attr-defined]
+    module.recent = LRUCachingDict[int, int](lambda key: key)  # type: ignore[attr-defined]
+    module.recent[1]  # type: ignore[attr-defined]
+    module.find(1)  # type: ignore[attr-defined]
+
+    caches = module_caches(module)
+    assert len(caches) == 4
+    clear_caches(caches)
+    assert module.find.cache_info().currsize == 0  # type: ignore[attr-defined]
+    assert module.lookup == {}  # type: ignore[attr-defined]
+    assert len(module.recent) == 0  # type: ignore[attr-defined]
+    assert len(module_caches(day_07)) == 1
+
+
+def test_prepare_without_parse():
+    module = ModuleType("day_plain")
+    module.part_1 = lambda input: input.upper()  # type: ignore[attr-defined]
+    run, parse_time = prepare(module, 1, "abc")
+    assert run() == "ABC"
+    assert math.isnan(parse_time)
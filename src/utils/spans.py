@@ -0,0 +1,110 @@
+# Standard Library
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Self, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_recordings: list[dict[str, int]] = []
+
+
+def _record(name: str, elapsed: int) -> None:
+    totals = _recordings[-1]
+    totals[name] = totals.get(name, 0) + elapsed
+
+
+class span:
+    __slots__ = ("name", "start")
+
+    def __init__(self: Self, name: str) -> None:
+        self.name = name
+        self.start = 0
+
+    def __enter__(self: Self) -> Self:
+        if _recordings:
+            self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        if _recordings and self.start:
+            _record(self.name, perf_counter_ns() - self.start)
+
+    def __call__(self: Self, func: F) -> F:
+        name = self.name
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _recordings:
+                return func(*args, **kwargs)
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if _recordings:
+                    _record(name, perf_counter_ns() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+
+@contextmanager
+def recording(enabled: bool = True) -> Generator[dict[str, int], None, None]:
+    totals: dict[str, int] = {}
+    if not enabled:
+        yield totals
+        return
+
+    _recordings.append(totals)
+    try:
+        yield totals
+    finally:
+        _recordings.pop()
+
+
+# --- tests
+
+
+def test_span_off_records_nothing():
+    with span("parse"):
+        pass
+    with recording() as totals:
+        pass
+    assert totals == {}
+
+
+def test_recording_disabled():
+    with recording(False) as totals, span("parse"):
+        pass
+    assert totals == {}
+
+
+def test_span_context_manager():
+    with recording() as totals:
+        with span("parse"):
+            sum(range(1000))
+        with span("parse"):
+            sum(range(1000))
+    assert list(totals) == ["parse"]
+    assert totals["parse"] > 0
+
+
+def test_span_decorator():
+    @span("solve")
+    def solve(n: int) -> int:
+        return n * 2
+
+    assert solve(2) == 4
+    with recording() as totals:
+        assert solve(3) == 6
+    assert totals["solve"] > 0
+
+
+def test_recording_nests():
+    with recording() as outer:
+        with recording() as inner, span("inner"):
+            pass
+        with span("outer"):
+            pass
+    assert list(inner) == ["inner"]
+    assert list(outer) == ["outer"]
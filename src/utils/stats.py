@@ -0,0 +1,222 @@
+# Standard Library
+import math
+import random
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from statistics import mean, median, quantiles, stdev
+from typing import Self
+
+# First Party
+from utils.execution import Usage
+from utils.gcstats import GCStats
+
+NS_PER_SECOND = 1_000_000_000
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    if len(samples) == 0:
+        return math.nan
+    if len(samples) == 1:
+        return samples[0]
+    return quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def reject_outliers(samples: list[float], k: float = 1.5) -> list[float]:
+    if len(samples) < 4:
+        return samples
+    q1, _, q3 = quantiles(samples, n=4, method="inclusive")
+    low, high = q1 - (q3 - q1) * k, q3 + (q3 - q1) * k
+    return [sample for sample in samples if low <= sample <= high]
+
+
+def speedup(
+    ours: Sequence[float],
+    theirs: Sequence[float],
+    confidence: float = 0.95,
+    resamples: int = 1000,
+) -> tuple[float, float, float]:
+    # Paired runs are compared run by run, then bootstrapped for an interval on the median ratio
+    ratios = [other / mine for mine, other in zip(ours, theirs) if mine > 0]
+    if not ratios:
+        return math.nan, math.nan, math.nan
+    rng = random.Random(0)
+    medians = sorted(median(rng.choices(ratios, k=len(ratios))) for _ in range(resamples))
+    tail = (1 - confidence) / 2
+    return median(ratios), medians[int(tail * resamples)], medians[min(int((1 - tail) * resamples), resamples - 1)]
+
+
+def human_time(seconds: float) -> str:
+    if math.isnan(seconds):
+        return "-"
+    for unit, scale in [("s", 1), ("ms", 1e3), ("µs", 1e6)]:
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.3f}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def human_bytes(size: float) -> str:
+    if math.isnan(size):
+        return "-"
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+@dataclass(frozen=True)
+class Memory:
+    traced_peak: float
+    rss_peak: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class Timing:
+    samples: list[float]
+    outliers: int = 0
+    error: str | None = None
+    phases: dict[str, float] = field(default_factory=dict)
+    parse: float = math.nan
+    warm: float = math.nan
+    gc_collections: int = 0
+    gc_pause: float = math.nan
+    usage: Usage | None = None
+    busy: float = math.nan
+    warm_error: str | None = None
+
+    @classmethod
+    def from_ns(  # noqa: PLR0913
+        cls,
+        samples_ns: list[int],
+        error: str | None = None,
+        phases_ns: dict[str, int] = {},
+        parse: float = math.nan,
+        warm_ns: list[int] = [],
+        gc: GCStats | None = None,
+        usage: Usage | None = None,
+        warm_error: str | None = None,
+    ) -> Self:
+        samples = sorted(sample / NS_PER_SECOND for sample in samples_ns)
+        kept = reject_outliers(samples)
+        total = sum(samples_ns)
+        phases = {name: phase / total for name, phase in phases_ns.items()} if total else {}
+        warm = median(warm_ns) / NS_PER_SECOND if warm_ns else math.nan
+        gc_pause = gc.pause / NS_PER_SECOND if gc is not None else math.nan
+        collections = gc.collections if gc is not None else 0
+        busy = usage.cpu / (total / NS_PER_SECOND) if usage is not None and total else math.nan
+        return cls(kept, len(samples) - len(kept), error, phases, parse, warm, collections, gc_pause, usage, busy, warm_error)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def iterations(self) -> int:
+        return len(self.samples) + self.outliers
+
+    @property
+    def min(self) -> float:
+        return min(self.samples, default=math.nan)
+
+    @property
+    def mean(self) -> float:
+        return mean(self.samples) if self.samples else math.nan
+
+    @property
+    def median(self) -> float:
+        return median(self.samples) if self.samples else math.nan
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def stddev(self) -> float:
+        return stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+
+# --- tests
+
+
+def test_percentile():
+    samples = [float(x) for x in range(1, 102)]
+    assert percentile(samples, 50) == 51
+    assert percentile(samples, 95) == 96
+    assert percentile([3.0], 95) == 3
+    assert math.isnan(percentile([], 95))
+
+
+def test_reject_outliers():
+    assert reject_outliers([1.0, 1.1, 0.9, 1.0, 1.05, 50.0]) == [1.0, 1.1, 0.9, 1.0, 1.05]
+    assert reject_outliers([1.0, 50.0]) == [1.0, 50.0]
+
+
+def test_speedup():
+    ratio, low, high = speedup([1.0, 1.1, 0.9, 1.0, 1.05] * 4, [2.0, 2.2, 1.8, 2.1, 2.0] * 4)
+    assert low <= ratio <= high
+    assert low > 1.8
+    assert high < 2.2
+    assert speedup([1.0, 1.0], [1.0, 1.0]) == (1.0, 1.0, 1.0)
+    assert all(math.isnan(value) for value in speedup([], []))
+
+
+def test_human_time():
+    assert human_time(1.5) == "1.500s"
+    assert human_time(0.0025) == "2.500ms"
+    assert human_time(0.0000025) == "2.500µs"
+    assert human_time(0.0000000025) == "2ns"
+    assert human_time(math.nan) == "-"
+
+
+def test_human_bytes():
+    assert human_bytes(512) == "512B"
+    assert human_bytes(1536) == "1.5KiB"
+    assert human_bytes(5 * 1024 * 1024) == "5.0MiB"
+    assert human_bytes(3 * 1024**3) == "3.0GiB"
+    assert human_bytes(math.nan) == "-"
+
+
+def test_timing_from_ns():
+    timing = Timing.from_ns([1_000, 1_100, 900, 1_000, 1_050, 50_000])
+    assert timing.outliers == 1
+    assert timing.iterations == 6
+    assert timing.min == 0.0000009
+    assert timing.median == 0.000001
+    assert timing.ok
+
+
+def test_timing_phases():
+    timing = Timing.from_ns([1_000, 1_000], phases_ns={"parse": 1_000})
+    assert timing.phases == {"parse": 0.5}
+
+
+def test_timing_warm():
+    assert Timing.from_ns([3_000, 3_000], warm_ns=[1_000, 2_000, 1_000]).warm == 0.000001
+    assert math.isnan(Timing.from_ns([1_000]).warm)
+    failed = Timing.from_ns([3_000], warm_error="RecursionError")
+    assert failed.ok
+    assert math.isnan(failed.warm)
+
+
+def test_timing_gc():
+    timing = Timing.from_ns([1_000], gc=GCStats(collections=3, pause=500))
+    assert (timing.gc_collections, timing.gc_pause) == (3, 0.0000005)
+    assert math.isnan(Timing.from_ns([1_000]).gc_pause)
+
+
+def test_timing_usage():
+    timing = Timing.from_ns([1_000_000, 3_000_000], usage=Usage(user=0.001, system=0.001))
+    assert timing.busy == 0.5
+    assert math.isnan(Timing.from_ns([1_000]).busy)
+
+
+def test_timing_error():
+    timing = Timing.from_ns([], "ValueError")
+    assert not timing.ok
+    assert math.isnan(timing.median)
+    assert timing.stddev == 0.0
@@ -0,0 +1,90 @@
+# Standard Library
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from types import ModuleType
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_registry: defaultdict[str, defaultdict[int, dict[str, Callable[[str], Any]]]] = defaultdict(lambda: defaultdict(dict))
+
+
+def variant(part: int, name: str) -> Callable[[F], F]:
+    def register(func: F) -> F:
+        _registry[func.__module__][part][name] = func
+        return func
+
+    return register
+
+
+def has_variants(module: ModuleType) -> bool:
+    return module.__name__ in _registry
+
+
+def variants(module: ModuleType, part: int) -> dict[str, Callable[[str], Any]]:
+    found: dict[str, Callable[[str], Any]] = {"default": getattr(module, f"part_{part}")}
+    if module.__name__ in _registry:
+        found.update(_registry[module.__name__][part])
+    return found
+
+
+def disagreement(module: ModuleType, part: int, inputs: Iterable[tuple[str, str]]) -> str | None:
+    for label, input in inputs:
+        answers: dict[str, Any] = {}
+        for name, func in variants(module, part).items():
+            try:
+                answers[name] = func(input)
+            except Exception as e:  # noqa: BLE001
+                return f"{name} raised {type(e).__name__} on {label}"
+        expected = answers.pop("default")
+        for name, answer in answers.items():
+            if answer != expected:
+                return f"{name} returned {answer!r} instead of {expected!r} on {label}"
+    return None
+
+
+# --- tests
+
+
+def _module(name: str) -> ModuleType:
+    module = ModuleType(name)
+    module.part_1 = len  # type: ignore[attr-defined]
+    module.part_2 = str.upper  # type: ignore[attr-defined]
+    return module
+
+
+def test_variants_default_only():
+    module = _module("day_plain")
+    assert not has_variants(module)
+    assert variants(module, 1) == {"default": len}
+
+
+def test_variant_registers_by_module():
+    module = _module("day_variants")
+
+    def counted(input: str) -> int:
+        return sum(1 for _ in input)
+
+    counted.__module__ = module.__name__
+    assert variant(1, "counted")(counted) is counted
+    assert has_variants(module)
+    assert variants(module, 1) == {"default": len, "counted": counted}
+    assert variants(module, 2) == {"default": str.upper}
+
+
+def test_disagreement():
+    module = _module("day_checked")
+
+    def wrong(input: str) -> int:
+        return len(input) + (input == "abc")
+
+    def broken(input: str) -> int:
+        raise ValueError(input)
+
+    wrong.__module__ = broken.__module__ = module.__name__
+    variant(1, "wrong")(wrong)
+    assert disagreement(module, 1, [("short", "ab")]) is None
+    assert disagreement(module, 1, [("short", "ab"), ("long", "abc")]) == "wrong returned 4 instead of 3 on long"
+
+    variant(2, "broken")(broken)
+    assert disagreement(module, 2, [("real", "x")]) == "broken raised ValueError on real"